@@ -2,21 +2,28 @@
 Google Automation MCP Server
 
 MCP server for Google Apps Script and Google Workspace automation.
-Supports 50 tools across Gmail, Drive, Sheets, Calendar, Docs, and Apps Script.
+Supports 53 tools across Gmail, Drive, Sheets, Calendar, Docs, and Apps Script.
 """
 
+import importlib
+from types import ModuleType
+from typing import Callable, Dict
+
 __version__ = "0.5.2"
 
-# Cache for lazy-loaded modules to avoid recursion
-_lazy_cache = {}
+# Lazily imported submodules, keyed by attribute name
+_LAZY: Dict[str, Callable[[], ModuleType]] = {
+    "appscript_tools": lambda: importlib.import_module(".appscript_tools", __name__),
+}
 
 
 def __getattr__(name):
     """Lazy import to avoid circular dependencies."""
-    if name == "appscript_tools":
-        if name not in _lazy_cache:
-            import importlib
+    loader = _LAZY.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-            _lazy_cache[name] = importlib.import_module(".appscript_tools", __name__)
-        return _lazy_cache[name]
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache in module globals so later lookups skip __getattr__ entirely
+    module = loader()
+    globals()[name] = module
+    return module
@@ -15,6 +15,7 @@ from .auth import (
 )
 
 # Import directly to avoid circular imports through tools/__init__.py
+from .tools.concurrency import run_blocking
 from .tools.error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
@@ -42,7 +43,7 @@ async def list_script_projects(
     Returns:
         str: Formatted list of script projects
     """
-    service = get_drive_service()
+    service = await asyncio.to_thread(get_drive_service)
 
     query = "mimeType='application/vnd.google-apps.script' and trashed=false"
     request_params = {
@@ -54,7 +55,7 @@ async def list_script_projects(
     if page_token:
         request_params["pageToken"] = page_token
 
-    response = await asyncio.to_thread(service.files().list(**request_params).execute)
+    response = await run_blocking(service.files().list(**request_params).execute)
 
     files = response.get("files", [])
 
@@ -89,11 +90,9 @@ async def get_script_project(script_id: str) -> str:
     Returns:
         str: Formatted project details with all file contents
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
-    project = await asyncio.to_thread(
-        service.projects().get(scriptId=script_id).execute
-    )
+    project = await run_blocking(service.projects().get(scriptId=script_id).execute)
 
     title = project.get("title", "Untitled")
     project_script_id = project.get("scriptId", "Unknown")
@@ -136,11 +135,9 @@ async def get_script_content(script_id: str, file_name: str) -> str:
     Returns:
         str: File content as string
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
-    project = await asyncio.to_thread(
-        service.projects().get(scriptId=script_id).execute
-    )
+    project = await run_blocking(service.projects().get(scriptId=script_id).execute)
 
     files = project.get("files", [])
     target_file = None
@@ -176,16 +173,14 @@ async def create_script_project(
     Returns:
         str: Formatted string with new project details
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
     request_body = {"title": title}
 
     if parent_id:
         request_body["parentId"] = parent_id
 
-    project = await asyncio.to_thread(
-        service.projects().create(body=request_body).execute
-    )
+    project = await run_blocking(service.projects().create(body=request_body).execute)
 
     script_id = project.get("scriptId", "Unknown")
     edit_url = f"https://script.google.com/d/{script_id}/edit"
@@ -212,10 +207,10 @@ async def delete_script_project(script_id: str) -> str:
     Returns:
         str: Confirmation message
     """
-    service = get_drive_service()
+    service = await asyncio.to_thread(get_drive_service)
 
     # Apps Script projects are stored as Drive files
-    await asyncio.to_thread(service.files().delete(fileId=script_id).execute)
+    await run_blocking(service.files().delete(fileId=script_id).execute)
 
     return f"Deleted Apps Script project: {script_id}"
 
@@ -236,11 +231,11 @@ async def update_script_content(
     Returns:
         str: Formatted string confirming update with file list
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
     request_body = {"files": files}
 
-    updated_content = await asyncio.to_thread(
+    updated_content = await run_blocking(
         service.projects().updateContent(scriptId=script_id, body=request_body).execute
     )
 
@@ -275,7 +270,7 @@ async def run_script_function(
     Returns:
         str: Formatted string with execution result or error
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
     request_body = {"function": function_name, "devMode": dev_mode}
 
@@ -283,7 +278,7 @@ async def run_script_function(
         request_body["parameters"] = parameters
 
     try:
-        response = await asyncio.to_thread(
+        response = await run_blocking(
             service.scripts().run(scriptId=script_id, body=request_body).execute
         )
 
@@ -329,11 +324,11 @@ async def create_deployment(
     Returns:
         str: Formatted string with deployment details
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
     # First, create a new version
     version_body = {"description": version_description or description}
-    version = await asyncio.to_thread(
+    version = await run_blocking(
         service.projects()
         .versions()
         .create(scriptId=script_id, body=version_body)
@@ -347,7 +342,7 @@ async def create_deployment(
         "description": description,
     }
 
-    deployment = await asyncio.to_thread(
+    deployment = await run_blocking(
         service.projects()
         .deployments()
         .create(scriptId=script_id, body=deployment_body)
@@ -377,9 +372,9 @@ async def list_deployments(script_id: str) -> str:
     Returns:
         str: Formatted string with deployment list
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
-    response = await asyncio.to_thread(
+    response = await run_blocking(
         service.projects().deployments().list(scriptId=script_id).execute
     )
 
@@ -419,13 +414,13 @@ async def update_deployment(
     Returns:
         str: Formatted string confirming update
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
     request_body = {}
     if description:
         request_body["description"] = description
 
-    deployment = await asyncio.to_thread(
+    deployment = await run_blocking(
         service.projects()
         .deployments()
         .update(scriptId=script_id, deploymentId=deployment_id, body=request_body)
@@ -453,9 +448,9 @@ async def delete_deployment(script_id: str, deployment_id: str) -> str:
     Returns:
         str: Confirmation message
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
-    await asyncio.to_thread(
+    await run_blocking(
         service.projects()
         .deployments()
         .delete(scriptId=script_id, deploymentId=deployment_id)
@@ -486,9 +481,9 @@ async def list_versions(script_id: str) -> str:
     Returns:
         str: Formatted string with version list
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
-    response = await asyncio.to_thread(
+    response = await run_blocking(
         service.projects().versions().list(scriptId=script_id).execute
     )
 
@@ -526,13 +521,13 @@ async def create_version(
     Returns:
         str: Formatted string with new version details
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
     request_body = {}
     if description:
         request_body["description"] = description
 
-    version = await asyncio.to_thread(
+    version = await run_blocking(
         service.projects()
         .versions()
         .create(scriptId=script_id, body=request_body)
@@ -563,9 +558,9 @@ async def get_version(script_id: str, version_number: int) -> str:
     Returns:
         str: Formatted string with version details
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
-    version = await asyncio.to_thread(
+    version = await run_blocking(
         service.projects()
         .versions()
         .get(scriptId=script_id, versionNumber=version_number)
@@ -605,15 +600,13 @@ async def list_script_processes(
     Returns:
         str: Formatted string with process list
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
     request_params = {"pageSize": page_size}
     if script_id:
         request_params["scriptId"] = script_id
 
-    response = await asyncio.to_thread(
-        service.processes().list(**request_params).execute
-    )
+    response = await run_blocking(service.processes().list(**request_params).execute)
 
     processes = response.get("processes", [])
 
@@ -657,7 +650,7 @@ async def get_script_metrics(
     Returns:
         str: Formatted string with metrics data
     """
-    service = get_script_service()
+    service = await asyncio.to_thread(get_script_service)
 
     # Build the metrics filter
     request_params = {
@@ -665,7 +658,7 @@ async def get_script_metrics(
         "metricsGranularity": metrics_granularity,
     }
 
-    response = await asyncio.to_thread(
+    response = await run_blocking(
         service.projects().getMetrics(**request_params).execute
     )
 
@@ -39,6 +39,7 @@ from .clasp import (
 from .google_auth import (
     get_credentials,
     get_credentials_for_user,
+    clear_cached_credentials,
     store_credentials,
     start_auth_flow,
     complete_auth_flow,
@@ -55,6 +56,7 @@ from .google_auth import (
     get_pending_flow,
     clear_pending_flow,
 )
+from .jwks import verify_id_token
 
 __all__ = [
     # Scopes
@@ -83,6 +85,7 @@ __all__ = [
     # Google Auth
     "get_credentials",
     "get_credentials_for_user",
+    "clear_cached_credentials",
     "store_credentials",
     "start_auth_flow",
     "complete_auth_flow",
@@ -98,4 +101,6 @@ __all__ = [
     "set_pending_flow",
     "get_pending_flow",
     "clear_pending_flow",
+    # ID token verification
+    "verify_id_token",
 ]
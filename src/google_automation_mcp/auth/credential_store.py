@@ -13,7 +13,7 @@ import stat
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Optional, List
 from datetime import datetime
 from google.oauth2.credentials import Credentials
 
@@ -78,6 +78,22 @@ class CredentialStore(ABC):
         """
         pass
 
+    def get_credential_stamp(self, user_email: str) -> Optional[Any]:
+        """
+        Get a value that changes whenever a user's stored credentials change.
+
+        In-process caches compare stamps to pick up credentials rewritten by
+        another process (e.g. the setup CLI). Stores that cannot tell return
+        None, in which case cached credentials are kept until cleared.
+
+        Args:
+            user_email: User's email address
+
+        Returns:
+            Comparable stamp, or None if unknown
+        """
+        return None
+
 
 class SecureCredentialStore(CredentialStore):
     """
@@ -134,6 +150,16 @@ class SecureCredentialStore(CredentialStore):
         if path.exists():
             os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
 
+    def get_credential_stamp(self, user_email: str) -> Optional[Any]:
+        """Get the credential file's inode, modification time and size."""
+        try:
+            st = self._get_credential_path(user_email).stat()
+        except OSError:
+            return None
+        # store_credential() replaces the file, so the inode changes on every
+        # write even when the mtime resolution is too coarse to tell
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
     def get_credential(self, user_email: str) -> Optional[Credentials]:
         """Get credentials from local JSON file."""
         creds_path = self._get_credential_path(user_email)
@@ -192,17 +218,27 @@ class SecureCredentialStore(CredentialStore):
             "stored_at": datetime.utcnow().isoformat(),
         }
 
+        # Write to a temp file created with secure permissions (600), then
+        # atomically replace, so a concurrent reader never sees a partial file
+        tmp_path = creds_path.with_name(creds_path.name + ".tmp")
+
         try:
-            with open(creds_path, "w") as f:
+            fd = os.open(
+                tmp_path,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                stat.S_IRUSR | stat.S_IWUSR,
+            )
+            with os.fdopen(fd, "w") as f:
                 json.dump(creds_data, f, indent=2)
 
-            # Set secure permissions
+            os.replace(tmp_path, creds_path)
             self._secure_file(creds_path)
 
             logger.info(f"Stored credentials for {user_email}")
             return True
         except IOError as e:
             logger.error(f"Error storing credentials for {user_email}: {e}")
+            tmp_path.unlink(missing_ok=True)
             return False
 
     def delete_credential(self, user_email: str) -> bool:
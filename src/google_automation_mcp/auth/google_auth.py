@@ -15,6 +15,8 @@ import json
 import jwt
 import logging
 import os
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
 
@@ -26,6 +28,7 @@ from google.auth.exceptions import RefreshError
 from .scopes import get_current_scopes
 from .credential_store import get_credential_store
 from .oauth_config import get_oauth_config
+from .transport import build_service
 
 # Import clasp functions from dedicated module
 from .clasp import get_clasp_tokens
@@ -109,9 +112,41 @@ def get_user_email_from_credentials(credentials: Credentials) -> Optional[str]:
 # =============================================================================
 
 
+# Refresh cached access tokens this long before they expire, so a tool call
+# never has to wait on the token endpoint.
+REFRESH_MARGIN = timedelta(seconds=60)
+
+# In-process credential cache: user_email -> (store stamp, Credentials)
+_credential_cache: Dict[str, Tuple[Any, Credentials]] = {}
+_credential_locks: Dict[str, threading.Lock] = {}
+_credential_locks_guard = threading.Lock()
+
+
+def _get_user_lock(user_email: str) -> threading.Lock:
+    """Get the lock serializing credential loads/refreshes for one user."""
+    with _credential_locks_guard:
+        return _credential_locks.setdefault(user_email, threading.Lock())
+
+
+def _needs_refresh(creds: Credentials) -> bool:
+    """Check if credentials are missing a token or expire within REFRESH_MARGIN."""
+    if not creds.token:
+        return True
+    if creds.expiry is None:
+        return False
+    # google-auth keeps expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - now < REFRESH_MARGIN
+
+
 def get_credentials_for_user(user_email: str) -> Optional[Credentials]:
     """
-    Get credentials for a specific user from the credential store.
+    Get credentials for a specific user.
+
+    Credentials are cached in-process and reloaded from the credential store
+    only when the stored copy changes (e.g. after re-running setup to add
+    scopes). Cached tokens are refreshed shortly before they expire and the
+    refreshed token is written back to the store.
 
     Args:
         user_email: User's email address
@@ -119,27 +154,57 @@ def get_credentials_for_user(user_email: str) -> Optional[Credentials]:
     Returns:
         Credentials object if found and valid, None otherwise
     """
-    store = get_credential_store()
-    creds = store.get_credential(user_email)
+    with _get_user_lock(user_email):
+        store = get_credential_store()
+        stamp = store.get_credential_stamp(user_email)
+        cached = _credential_cache.get(user_email)
+
+        if cached is not None and cached[0] == stamp:
+            creds = cached[1]
+        else:
+            creds = store.get_credential(user_email)
+            if creds is None:
+                _credential_cache.pop(user_email, None)
+                return None
+            _credential_cache[user_email] = (stamp, creds)
+
+        if not _needs_refresh(creds):
+            return creds
+
+        # Refresh proactively (or because the token already expired)
+        if creds.refresh_token:
+            try:
+                creds.refresh(Request())
+                store.store_credential(user_email, creds)
+                # Our own write shouldn't look like an outside change
+                _credential_cache[user_email] = (
+                    store.get_credential_stamp(user_email),
+                    creds,
+                )
+                logger.info(f"Refreshed credentials for {user_email}")
+                return creds
+            except RefreshError as e:
+                logger.warning(f"Failed to refresh credentials for {user_email}: {e}")
+
+        # Still usable if the refresh was only proactive
+        if creds.valid:
+            return creds
 
-    if creds is None:
+        _credential_cache.pop(user_email, None)
         return None
 
-    # Check if valid
-    if creds.valid:
-        return creds
 
-    # Try to refresh if expired
-    if creds.expired and creds.refresh_token:
-        try:
-            creds.refresh(Request())
-            store.store_credential(user_email, creds)
-            logger.info(f"Refreshed credentials for {user_email}")
-            return creds
-        except RefreshError as e:
-            logger.warning(f"Failed to refresh credentials for {user_email}: {e}")
+def clear_cached_credentials(user_email: Optional[str] = None) -> None:
+    """
+    Drop cached credentials so the next lookup reloads them from the store.
 
-    return None
+    Args:
+        user_email: User to drop, or None to clear the whole cache
+    """
+    if user_email is None:
+        _credential_cache.clear()
+    else:
+        _credential_cache.pop(user_email, None)
 
 
 def get_any_valid_credentials() -> Optional[Tuple[str, Credentials]]:
@@ -215,7 +280,10 @@ def store_credentials(
         return False
 
     store = get_credential_store()
-    return store.store_credential(user_email, credentials)
+    stored = store.store_credential(user_email, credentials)
+    if stored:
+        _credential_cache[user_email] = credentials
+    return stored
 
 
 # =============================================================================
@@ -384,15 +452,13 @@ def get_service(
     Raises:
         ValueError if no valid credentials available
     """
-    from googleapiclient.discovery import build
-
     if credentials is None:
         credentials = get_credentials()
 
     if credentials is None:
         raise ValueError("No valid credentials. Run: google-automation-mcp setup")
 
-    return build(service_name, version, credentials=credentials)
+    return build_service(service_name, version, credentials)
 
 
 def get_script_service(credentials: Optional[Credentials] = None):
@@ -15,14 +15,15 @@ Usage:
         return service.files().list().execute()
 """
 
+import asyncio
 import logging
 from functools import wraps
 from typing import Optional, Callable, Any
 
-from googleapiclient.discovery import build
-
+from ..core.context import get_rate_limit_key, set_rate_limit_key
 from .credential_store import get_credential_store
 from .google_auth import get_credentials, get_credentials_for_user
+from .transport import build_service
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +56,7 @@ def get_service_for_user(
         if credentials is None:
             raise ValueError("No valid credentials. Run: google-automation-mcp setup")
 
-    return build(service_name, version, credentials=credentials)
+    return build_service(service_name, version, credentials, user_email)
 
 
 def with_service(service_name: str, version: str):
@@ -78,9 +79,12 @@ def with_service(service_name: str, version: str):
             # Extract user_google_email from kwargs
             user_email = kwargs.get("user_google_email")
 
-            # Get authenticated service
+            # Get authenticated service off the event loop: loading credentials
+            # reads from disk and may refresh the access token over HTTPS.
             try:
-                service = get_service_for_user(service_name, version, user_email)
+                service = await asyncio.to_thread(
+                    get_service_for_user, service_name, version, user_email
+                )
             except ValueError as e:
                 return f"Authentication error: {e}"
 
@@ -92,8 +96,14 @@ def with_service(service_name: str, version: str):
                     user_email = users[0]
                     kwargs["user_google_email"] = user_email
 
-            # Call the wrapped function with injected service
-            return await func(service, *args, **kwargs)
+            # Call the wrapped function with injected service, pacing its API
+            # calls against this service's per-user rate limit
+            previous_key = get_rate_limit_key()
+            set_rate_limit_key((service_name, user_email))
+            try:
+                return await func(service, *args, **kwargs)
+            finally:
+                set_rate_limit_key(previous_key)
 
         return wrapper
 
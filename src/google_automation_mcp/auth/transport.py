@@ -0,0 +1,272 @@
+"""
+Shared HTTP Transport for Google API Services
+
+Builds Google API services on a process-wide HTTP/2 transport and memoizes
+them per user, so concurrent tool calls are multiplexed over open TLS
+connections instead of paying a new TCP+TLS handshake on every request.
+
+Services are built from the discovery documents bundled with
+google-api-python-client, read once per process, so building a service never
+fetches discovery JSON over the network.
+"""
+
+import functools
+import json
+import logging
+import socket
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import httplib2
+import httpx
+import orjson
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.model import JsonModel
+
+logger = logging.getLogger(__name__)
+
+# Connection pool size for the shared transport; HTTP/2 multiplexes many
+# concurrent requests over each connection
+MAX_CONNECTIONS = 16
+REQUEST_TIMEOUT = 30.0
+
+
+class HttpxTransport:
+    """
+    httplib2.Http-compatible transport backed by a shared HTTP/2 httpx client.
+
+    googleapiclient and google_auth_httplib2 only call request() and expect
+    httplib2's (Response, content) tuple back. Implementing that on top of one
+    thread-safe httpx.Client lets concurrent API calls from worker threads
+    multiplex over a single HTTP/2 connection per Google host, instead of each
+    thread holding its own HTTP/1.1 connections.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = MAX_CONNECTIONS,
+        timeout: float = REQUEST_TIMEOUT,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            max_connections: Maximum number of pooled connections
+            timeout: Request timeout in seconds
+        """
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """Get the shared client, reopening it if it was closed."""
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                )
+            return self._client
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        redirections: int = httplib2.DEFAULT_MAX_REDIRECTS,
+        connection_type: Any = None,
+    ) -> Tuple[httplib2.Response, bytes]:
+        """
+        Issue a request, mirroring httplib2.Http.request().
+
+        Args:
+            uri: Absolute request URI
+            method: HTTP method
+            body: Request body (str or bytes)
+            headers: Request headers
+            redirections: Ignored; the client follows up to 20 redirects
+            connection_type: Ignored; accepted for httplib2 compatibility
+
+        Returns:
+            Tuple of (httplib2.Response, response body bytes)
+        """
+        try:
+            response = self._get_client().request(
+                method, uri, content=body, headers=headers
+            )
+        except httpx.TimeoutException as e:
+            # googleapiclient retries socket timeouts and connection errors
+            raise socket.timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+
+        info = {"status": str(response.status_code)}
+        for name, value in response.headers.multi_items():
+            name = name.lower()
+            # httpx has already decoded the body, so these no longer apply
+            if name in ("content-encoding", "content-length"):
+                continue
+            info[name] = f"{info[name]}, {value}" if name in info else value
+
+        http_response = httplib2.Response(info)
+        http_response.reason = response.reason_phrase
+        return http_response, response.content
+
+    def close(self) -> None:
+        """Close all pooled connections; the next request reconnects."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+
+
+class OrjsonModel(JsonModel):
+    """
+    JsonModel that encodes request bodies and decodes responses with orjson.
+
+    Large Sheets and Drive payloads spend most of their client-side time in
+    JSON parsing and encoding; orjson does both several times faster than the
+    stdlib json module googleapiclient uses by default.
+    """
+
+    def serialize(self, body_value: Any) -> str:
+        """Encode a request body, falling back to json for unsupported values."""
+        if (
+            isinstance(body_value, dict)
+            and "data" not in body_value
+            and self._data_wrapper
+        ):
+            body_value = {"data": body_value}
+        try:
+            return orjson.dumps(body_value).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits
+            return json.dumps(body_value)
+
+    def deserialize(self, content: Any) -> Any:
+        """Decode a response body, returning non-JSON content unchanged."""
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+_shared_http = HttpxTransport()
+_json_model = OrjsonModel()
+
+
+def close_transport() -> None:
+    """Close the shared transport's connections (e.g., on server shutdown)."""
+    _shared_http.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _discovery_document(service_name: str, version: str) -> Optional[str]:
+    """
+    Get the bundled discovery document for an API, read from disk only once.
+
+    The raw JSON is cached rather than the parsed dict, because
+    build_from_document mutates the method descriptions it is given.
+
+    Args:
+        service_name: API service name (e.g., "gmail", "drive")
+        version: API version (e.g., "v1", "v3")
+
+    Returns:
+        Discovery document JSON, or None if the API isn't bundled
+    """
+    document = get_static_doc(service_name, version)
+    if document is None:
+        logger.warning(f"No bundled discovery document for {service_name} {version}")
+    return document
+
+
+# Maximum number of memoized services; least recently used ones are evicted
+MAX_CACHED_SERVICES = 128
+
+# (service, version, user) -> (credentials, service)
+_services: OrderedDict = OrderedDict()
+_services_lock = threading.Lock()
+
+
+def _same_grant(cached: Credentials, credentials: Credentials) -> bool:
+    """Whether a service built for cached credentials can serve credentials."""
+    if cached is credentials:
+        return True
+    # A service holding the same refresh token renews its own access token
+    if credentials.refresh_token:
+        return cached.refresh_token == credentials.refresh_token
+    return cached.token == credentials.token
+
+
+def build_service(
+    service_name: str,
+    version: str,
+    credentials: Credentials,
+    user_email: Optional[str] = None,
+) -> Any:
+    """
+    Get a Google API service bound to the shared HTTP transport.
+
+    Services are memoized per (service, version, user) so the discovery
+    document is only processed once per user. The cached service refreshes its
+    own access token when it expires; it is rebuilt if the user's credentials
+    are replaced (e.g., after re-authentication).
+
+    Args:
+        service_name: API service name (e.g., "gmail", "drive")
+        version: API version (e.g., "v1", "v3")
+        credentials: Credentials to authorize requests with
+        user_email: The user the credentials belong to, if known
+
+    Returns:
+        Google API service object
+    """
+    key = (service_name, version, user_email)
+
+    with _services_lock:
+        entry = _services.get(key)
+        if entry is not None and _same_grant(entry[0], credentials):
+            _services.move_to_end(key)
+            return entry[1]
+
+    http = AuthorizedHttp(credentials, http=_shared_http)
+    document = _discovery_document(service_name, version)
+    if document is not None:
+        service = build_from_document(document, http=http, model=_json_model)
+    else:
+        service = build(
+            service_name,
+            version,
+            http=http,
+            model=_json_model,
+            cache_discovery=False,
+        )
+    logger.debug(f"Built {service_name} {version} service")
+
+    with _services_lock:
+        _services[key] = (credentials, service)
+        _services.move_to_end(key)
+        while len(_services) > MAX_CACHED_SERVICES:
+            _services.popitem(last=False)
+
+    return service
+
+
+def clear_service_cache() -> None:
+    """Drop all memoized services (e.g., after credentials are revoked)."""
+    with _services_lock:
+        _services.clear()
@@ -9,11 +9,21 @@ from .context import (
     set_injected_oauth_credentials,
     get_fastmcp_session_id,
     set_fastmcp_session_id,
+    get_rate_limit_key,
+    set_rate_limit_key,
 )
+from .ratelimit import TokenBucket, RATE_LIMITS, get_bucket, acquire_rate_limit
 
 __all__ = [
     "get_injected_oauth_credentials",
     "set_injected_oauth_credentials",
     "get_fastmcp_session_id",
     "set_fastmcp_session_id",
+    "get_rate_limit_key",
+    "set_rate_limit_key",
+    # Rate limiting
+    "TokenBucket",
+    "RATE_LIMITS",
+    "get_bucket",
+    "acquire_rate_limit",
 ]
@@ -5,7 +5,7 @@ Forked from google_workspace_mcp/core/context.py
 """
 
 import contextvars
-from typing import Optional
+from typing import Optional, Tuple
 
 # Context variable to hold injected credentials for the life of a single request.
 _injected_oauth_credentials = contextvars.ContextVar(
@@ -15,6 +15,10 @@ _injected_oauth_credentials = contextvars.ContextVar(
 # Context variable to hold FastMCP session ID for the life of a single request.
 _fastmcp_session_id = contextvars.ContextVar("fastmcp_session_id", default=None)
 
+# Context variable to hold the (service, user) whose rate limit applies to
+# Google API calls made while handling a single request.
+_rate_limit_key = contextvars.ContextVar("rate_limit_key", default=None)
+
 
 def get_injected_oauth_credentials():
     """
@@ -46,3 +50,19 @@ def set_fastmcp_session_id(session_id: Optional[str]):
     This is called when a FastMCP request starts.
     """
     _fastmcp_session_id.set(session_id)
+
+
+def get_rate_limit_key() -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Retrieve the (service, user) rate limit key for the current request context.
+    This is called before each blocking Google API call.
+    """
+    return _rate_limit_key.get()
+
+
+def set_rate_limit_key(key: Optional[Tuple[str, Optional[str]]]):
+    """
+    Set or clear the (service, user) rate limit key for the current request context.
+    This is called by the service decorator.
+    """
+    _rate_limit_key.set(key)
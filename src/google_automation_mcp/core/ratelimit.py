@@ -0,0 +1,127 @@
+"""
+Client-side rate limiting for Google API calls.
+
+Google enforces per-user request quotas and answers bursts beyond them with
+429/403 rate-limit errors. Pacing requests with a token bucket per
+(service, user) keeps concurrent tool calls under those quotas, so they wait
+briefly instead of failing or backing off.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# Per-user limits as (requests per second, burst size), kept below Google's
+# published quotas. Services not listed here are not limited.
+RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    # Gmail: 250 quota units/user/second, most calls cost 5-10 units
+    "gmail": (25.0, 25),
+    # Drive: 12,000 requests/user/minute
+    "drive": (100.0, 100),
+    # Sheets: 60 requests/user/minute
+    "sheets": (1.0, 60),
+    # Calendar: 600 requests/user/minute
+    "calendar": (10.0, 20),
+    # Docs: 60 write requests/user/minute
+    "docs": (1.0, 60),
+}
+
+
+class TokenBucket:
+    """
+    Token bucket that refills lazily on each acquire.
+
+    Callers reserve tokens up front, letting the balance go negative, and then
+    sleep until their share has refilled. Waiters are therefore served in
+    arrival order without a background refill task, and the bucket holds no
+    asyncio primitives, so it can be shared across event loops.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize the bucket (full).
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket holds
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, n: int) -> float:
+        """Take n tokens and return how long to wait until they are available."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= n
+            return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self, n: int = 1) -> None:
+        """
+        Wait until n tokens are available.
+
+        Args:
+            n: Number of tokens (requests) to acquire
+        """
+        delay = self._reserve(n)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Maximum number of buckets kept; least recently used ones are evicted. An
+# evicted user only starts again from a full bucket.
+MAX_BUCKETS = 512
+
+# (service, user) -> TokenBucket
+_buckets: OrderedDict = OrderedDict()
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(service_name: str, user_email: Optional[str]) -> Optional[TokenBucket]:
+    """
+    Get the token bucket for a service and user.
+
+    Args:
+        service_name: API service name (e.g., "gmail", "sheets")
+        user_email: The user requests are made for
+
+    Returns:
+        The shared TokenBucket, or None if the service is not rate limited
+    """
+    limit = RATE_LIMITS.get(service_name)
+    if limit is None:
+        return None
+
+    key = (service_name, user_email)
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(*limit)
+            _buckets[key] = bucket
+        _buckets.move_to_end(key)
+        while len(_buckets) > MAX_BUCKETS:
+            _buckets.popitem(last=False)
+    return bucket
+
+
+async def acquire_rate_limit(
+    service_name: str, user_email: Optional[str], n: int = 1
+) -> None:
+    """
+    Wait for the rate limit before issuing n requests.
+
+    Args:
+        service_name: API service name (e.g., "gmail", "sheets")
+        user_email: The user requests are made for
+        n: Number of requests about to be issued
+    """
+    bucket = get_bucket(service_name, user_email)
+    if bucket is not None:
+        await bucket.acquire(n)
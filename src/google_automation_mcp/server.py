@@ -10,14 +10,22 @@ Tool registrations are split into modules:
 - server_workspace.py: Gmail, Drive, Sheets, Calendar, and Docs tools
 """
 
+import asyncio
 import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
+import anyio
 from fastmcp import FastMCP
 
 from . import __version__
+from .auth.transport import close_transport
 from .server_auth import register_auth_tools
 from .server_appscript import register_appscript_tools
 from .server_workspace import register_workspace_tools
+from .tools.batch import get_batch_coalescer
+from .tools.concurrency import MAX_WORKER_THREADS
 
 # Configure logging
 logging.basicConfig(
@@ -26,8 +34,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+# Event loops that already have the Google API executor installed
+_executor_loops = weakref.WeakSet()
+
+# Number of sessions currently inside the lifespan, per event loop
+_active_sessions = weakref.WeakKeyDictionary()
+
+
+@asynccontextmanager
+async def lifespan(server):
+    """
+    Install a default executor sized for concurrent Google API calls, and stop
+    the batch worker once the last session ends.
+    """
+    # HTTP transports enter the lifespan once per session, so install the
+    # executor once per loop and leave it in place: shutting it down when one
+    # session ends would break to_thread calls in the others. The loop shuts
+    # its default executor down when it closes.
+    loop = asyncio.get_running_loop()
+    if loop not in _executor_loops:
+        loop.set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=MAX_WORKER_THREADS, thread_name_prefix="google-api"
+            )
+        )
+        _executor_loops.add(loop)
+
+    _active_sessions[loop] = _active_sessions.get(loop, 0) + 1
+    try:
+        yield {}
+    finally:
+        _active_sessions[loop] -= 1
+        if not _active_sessions[loop]:
+            # Last session out stops the batch worker; the next request
+            # starts a new one
+            await get_batch_coalescer().aclose()
+
+
 # Create MCP server
-mcp = FastMCP("Apps Script MCP")
+mcp = FastMCP("Apps Script MCP", lifespan=lifespan)
 
 # Register all tools
 register_auth_tools(mcp)
@@ -35,12 +81,36 @@ register_appscript_tools(mcp)
 register_workspace_tools(mcp)
 
 
+def _event_loop_options() -> dict:
+    """
+    Get anyio backend options that run the server on uvloop if it is installed
+    (the "fast" extra).
+
+    anyio creates the loop from uvloop's loop factory, so neither
+    uvloop.install() nor asyncio.set_event_loop_policy() (both deprecated as
+    of Python 3.14) is needed.
+    """
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return {}
+
+    logger.info("Using uvloop event loop")
+    return {"use_uvloop": True}
+
+
 def main():
     """Run the MCP server."""
+    backend_options = _event_loop_options()
     logger.info(f"Starting Apps Script MCP Server v{__version__}")
     logger.info("Authentication: clasp (recommended) or OAuth 2.0/2.1")
     logger.info("Run 'google-automation-mcp setup' to configure authentication")
-    mcp.run()
+    try:
+        # Same as mcp.run(), which has no way to pass anyio backend options
+        anyio.run(mcp.run_async, backend_options=backend_options)
+    finally:
+        # Shared by every session, so only closed once the server exits
+        close_transport()
 
 
 if __name__ == "__main__":
@@ -4,6 +4,11 @@ Google Workspace Tool Registrations
 Registers Gmail, Drive, Sheets, Calendar, and Docs tools with the MCP server.
 """
 
+import inspect
+from typing import Awaitable, Callable, NamedTuple, Tuple
+
+from fastmcp.tools import Tool
+
 from .tools import (
     # Gmail
     search_gmail_messages,
@@ -11,6 +16,7 @@ from .tools import (
     send_gmail_message,
     list_gmail_labels,
     modify_gmail_labels,
+    modify_gmail_labels_bulk,
     # Drive
     search_drive_files,
     list_drive_items,
@@ -22,6 +28,7 @@ from .tools import (
     share_drive_file,
     list_drive_permissions,
     remove_drive_permission,
+    remove_drive_permissions_bulk,
     # Sheets
     list_spreadsheets,
     get_sheet_values,
@@ -35,6 +42,7 @@ from .tools import (
     create_event,
     delete_event,
     update_event,
+    delete_events_bulk,
     # Docs
     search_docs,
     get_doc_content,
@@ -44,64 +52,139 @@ from .tools import (
 )
 
 
-def register_workspace_tools(mcp):
-    """Register Google Workspace tools with the MCP server."""
-
-    # ========================================================================
-    # Gmail Tools
-    # ========================================================================
-
-    @mcp.tool()
-    async def search_gmail_messages_tool(
-        user_google_email: str,
-        query: str = "",
-        max_results: int = 10,
-    ) -> str:
-        """
+def _coalesce(args: dict, optional: tuple = ()) -> dict:
+    """
+    Build implementation kwargs from a wrapper's bound arguments.
+
+    MCP clients send "" for omitted string arguments; the implementations
+    expect None for those, so each name in optional maps a falsy value to None.
+
+    Args:
+        args: The wrapper's arguments, keyed by parameter name
+        optional: Names of parameters whose empty values mean "not provided"
+
+    Returns:
+        Keyword arguments for the implementation function
+    """
+    return {k: (v or None) if k in optional else v for k, v in args.items()}
+
+
+class ToolSpec(NamedTuple):
+    """
+    Declarative description of a workspace tool.
+
+    Attributes:
+        name: Tool name exposed to MCP clients
+        impl: Implementation function from google_automation_mcp.tools
+        params: (name, annotation) or (name, annotation, default) per parameter
+        doc: Tool description, including the Args section
+        optional: Parameters whose empty values are passed to impl as None
+    """
+
+    name: str
+    impl: Callable[..., Awaitable[str]]
+    params: Tuple[tuple, ...]
+    doc: str
+    optional: Tuple[str, ...] = ()
+
+
+def _make_wrapper(spec: ToolSpec) -> Callable[..., Awaitable[str]]:
+    """
+    Build the MCP-facing wrapper function for a tool spec.
+
+    The wrapper advertises spec.params as its signature, so FastMCP derives the
+    tool's input schema from it, and forwards calls to spec.impl.
+
+    Args:
+        spec: The tool to build a wrapper for
+
+    Returns:
+        Async function suitable for Tool.from_function
+    """
+    signature = inspect.Signature(
+        [
+            inspect.Parameter(
+                param[0],
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=param[1],
+                default=param[2] if len(param) > 2 else inspect.Parameter.empty,
+            )
+            for param in spec.params
+        ],
+        return_annotation=str,
+    )
+
+    async def wrapper(*args, **kwargs) -> str:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return await spec.impl(**_coalesce(bound.arguments, spec.optional))
+
+    wrapper.__name__ = wrapper.__qualname__ = spec.name
+    wrapper.__doc__ = inspect.cleandoc(spec.doc)
+    wrapper.__signature__ = signature
+    wrapper.__annotations__ = {
+        **{name: param.annotation for name, param in signature.parameters.items()},
+        "return": str,
+    }
+    return wrapper
+
+
+_WORKSPACE_TOOLS = (
+    # Gmail
+    ToolSpec(
+        name="search_gmail_messages_tool",
+        impl=search_gmail_messages,
+        params=(
+            ("user_google_email", str),
+            ("query", str, ""),
+            ("max_results", int, 10),
+            ("fields", str, ""),
+        ),
+        optional=("fields",),
+        doc="""
         Search for Gmail messages matching a query.
 
         Args:
             user_google_email: The user's Google email address
             query: Gmail search query (e.g., "from:user@example.com subject:hello")
             max_results: Maximum number of messages to return (default: 10)
-        """
-        return await search_gmail_messages(
-            user_google_email=user_google_email,
-            query=query,
-            max_results=max_results,
-        )
-
-    @mcp.tool()
-    async def get_gmail_message_tool(
-        user_google_email: str,
-        message_id: str,
-        format: str = "full",
-    ) -> str:
-        """
+            fields: Optional partial-response field mask overriding the default
+        """,
+    ),
+    ToolSpec(
+        name="get_gmail_message_tool",
+        impl=get_gmail_message,
+        params=(
+            ("user_google_email", str),
+            ("message_id", str),
+            ("format", str, "full"),
+            ("fields", str, ""),
+        ),
+        optional=("fields",),
+        doc="""
         Get a specific Gmail message by ID.
 
         Args:
             user_google_email: The user's Google email address
             message_id: The message ID to retrieve
             format: Message format - "full", "metadata", or "minimal"
-        """
-        return await get_gmail_message(
-            user_google_email=user_google_email,
-            message_id=message_id,
-            format=format,
-        )
-
-    @mcp.tool()
-    async def send_gmail_message_tool(
-        user_google_email: str,
-        to: str,
-        subject: str,
-        body: str,
-        cc: str = "",
-        bcc: str = "",
-        html: bool = False,
-    ) -> str:
-        """
+            fields: Optional partial-response field mask overriding the default
+        """,
+    ),
+    ToolSpec(
+        name="send_gmail_message_tool",
+        impl=send_gmail_message,
+        params=(
+            ("user_google_email", str),
+            ("to", str),
+            ("subject", str),
+            ("body", str),
+            ("cc", str, ""),
+            ("bcc", str, ""),
+            ("html", bool, False),
+        ),
+        optional=("cc", "bcc"),
+        doc="""
         Send a Gmail message.
 
         Args:
@@ -112,35 +195,29 @@ def register_workspace_tools(mcp):
             cc: Optional CC recipients, comma-separated
             bcc: Optional BCC recipients, comma-separated
             html: If True, body is treated as HTML
-        """
-        return await send_gmail_message(
-            user_google_email=user_google_email,
-            to=to,
-            subject=subject,
-            body=body,
-            cc=cc if cc else None,
-            bcc=bcc if bcc else None,
-            html=html,
-        )
-
-    @mcp.tool()
-    async def list_gmail_labels_tool(user_google_email: str) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="list_gmail_labels_tool",
+        impl=list_gmail_labels,
+        params=(("user_google_email", str),),
+        doc="""
         List all Gmail labels for the user.
 
         Args:
             user_google_email: The user's Google email address
-        """
-        return await list_gmail_labels(user_google_email=user_google_email)
-
-    @mcp.tool()
-    async def modify_gmail_labels_tool(
-        user_google_email: str,
-        message_id: str,
-        add_labels: list = None,
-        remove_labels: list = None,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="modify_gmail_labels_tool",
+        impl=modify_gmail_labels,
+        params=(
+            ("user_google_email", str),
+            ("message_id", str),
+            ("add_labels", list, None),
+            ("remove_labels", list, None),
+        ),
+        doc="""
         Modify labels on a Gmail message.
 
         Common label IDs:
@@ -163,25 +240,41 @@ def register_workspace_tools(mcp):
             - Mark unread: add_labels=["UNREAD"]
             - Star: add_labels=["STARRED"]
             - Move to trash: add_labels=["TRASH"]
-        """
-        return await modify_gmail_labels(
-            user_google_email=user_google_email,
-            message_id=message_id,
-            add_labels=add_labels,
-            remove_labels=remove_labels,
-        )
-
-    # ========================================================================
-    # Drive Tools
-    # ========================================================================
-
-    @mcp.tool()
-    async def search_drive_files_tool(
-        user_google_email: str,
-        query: str,
-        page_size: int = 10,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="modify_gmail_labels_bulk_tool",
+        impl=modify_gmail_labels_bulk,
+        params=(
+            ("user_google_email", str),
+            ("message_ids", list),
+            ("add_labels", list, None),
+            ("remove_labels", list, None),
+        ),
+        doc="""
+        Modify labels on many Gmail messages at once.
+
+        Prefer this over calling modify_gmail_labels_tool once per message.
+
+        Args:
+            user_google_email: The user's Google email address
+            message_ids: List of message IDs to modify
+            add_labels: List of label IDs to add (e.g., ["STARRED", "IMPORTANT"])
+            remove_labels: List of label IDs to remove (e.g., ["UNREAD", "INBOX"])
+        """,
+    ),
+    # Drive
+    ToolSpec(
+        name="search_drive_files_tool",
+        impl=search_drive_files,
+        params=(
+            ("user_google_email", str),
+            ("query", str),
+            ("page_size", int, 10),
+            ("fields", str, ""),
+        ),
+        optional=("fields",),
+        doc="""
         Search for files and folders in Google Drive.
 
         Args:
@@ -192,39 +285,38 @@ def register_workspace_tools(mcp):
                    - fullText contains 'keyword'
                    - modifiedTime > '2024-01-01'
             page_size: Maximum number of files to return (default: 10)
-        """
-        return await search_drive_files(
-            user_google_email=user_google_email,
-            query=query,
-            page_size=page_size,
-        )
-
-    @mcp.tool()
-    async def list_drive_items_tool(
-        user_google_email: str,
-        folder_id: str = "root",
-        page_size: int = 50,
-    ) -> str:
-        """
+            fields: Optional partial-response field mask overriding the default
+        """,
+    ),
+    ToolSpec(
+        name="list_drive_items_tool",
+        impl=list_drive_items,
+        params=(
+            ("user_google_email", str),
+            ("folder_id", str, "root"),
+            ("page_size", int, 50),
+            ("fields", str, ""),
+        ),
+        optional=("fields",),
+        doc="""
         List files and folders in a Drive folder.
 
         Args:
             user_google_email: The user's Google email address
             folder_id: The folder ID to list (default: 'root' for My Drive root)
             page_size: Maximum number of items to return (default: 50)
-        """
-        return await list_drive_items(
-            user_google_email=user_google_email,
-            folder_id=folder_id,
-            page_size=page_size,
-        )
-
-    @mcp.tool()
-    async def get_drive_file_content_tool(
-        user_google_email: str,
-        file_id: str,
-    ) -> str:
-        """
+            fields: Optional partial-response field mask overriding the default
+        """,
+    ),
+    ToolSpec(
+        name="get_drive_file_content_tool",
+        impl=get_drive_file_content,
+        params=(
+            ("user_google_email", str),
+            ("file_id", str),
+            ("max_bytes", int, 10 * 1024 * 1024),
+        ),
+        doc="""
         Get the content of a Google Drive file.
 
         Supports Google Docs (-> text), Sheets (-> CSV), Slides (-> text), and text files.
@@ -232,21 +324,20 @@ def register_workspace_tools(mcp):
         Args:
             user_google_email: The user's Google email address
             file_id: The Drive file ID
-        """
-        return await get_drive_file_content(
-            user_google_email=user_google_email,
-            file_id=file_id,
-        )
-
-    @mcp.tool()
-    async def create_drive_file_tool(
-        user_google_email: str,
-        file_name: str,
-        content: str = "",
-        folder_id: str = "root",
-        mime_type: str = "text/plain",
-    ) -> str:
-        """
+            max_bytes: Maximum number of bytes to return (default: 10 MB)
+        """,
+    ),
+    ToolSpec(
+        name="create_drive_file_tool",
+        impl=create_drive_file,
+        params=(
+            ("user_google_email", str),
+            ("file_name", str),
+            ("content", str, ""),
+            ("folder_id", str, "root"),
+            ("mime_type", str, "text/plain"),
+        ),
+        doc="""
         Create a new file in Google Drive.
 
         Args:
@@ -255,41 +346,33 @@ def register_workspace_tools(mcp):
             content: File content (text)
             folder_id: Parent folder ID (default: 'root')
             mime_type: MIME type of the file (default: 'text/plain')
-        """
-        return await create_drive_file(
-            user_google_email=user_google_email,
-            file_name=file_name,
-            content=content,
-            folder_id=folder_id,
-            mime_type=mime_type,
-        )
-
-    @mcp.tool()
-    async def create_drive_folder_tool(
-        user_google_email: str,
-        folder_name: str,
-        parent_id: str = "root",
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="create_drive_folder_tool",
+        impl=create_drive_folder,
+        params=(
+            ("user_google_email", str),
+            ("folder_name", str),
+            ("parent_id", str, "root"),
+        ),
+        doc="""
         Create a new folder in Google Drive.
 
         Args:
             user_google_email: The user's Google email address
             folder_name: Name for the new folder
             parent_id: Parent folder ID (default: 'root' for My Drive root)
-        """
-        return await create_drive_folder(
-            user_google_email=user_google_email,
-            folder_name=folder_name,
-            parent_id=parent_id,
-        )
-
-    @mcp.tool()
-    async def delete_drive_file_tool(
-        user_google_email: str,
-        file_id: str,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="delete_drive_file_tool",
+        impl=delete_drive_file,
+        params=(
+            ("user_google_email", str),
+            ("file_id", str),
+        ),
+        doc="""
         Permanently delete a file from Google Drive.
 
         WARNING: This permanently deletes the file. Use trash_drive_file for recoverable deletion.
@@ -297,38 +380,37 @@ def register_workspace_tools(mcp):
         Args:
             user_google_email: The user's Google email address
             file_id: The file ID to delete
-        """
-        return await delete_drive_file(
-            user_google_email=user_google_email,
-            file_id=file_id,
-        )
-
-    @mcp.tool()
-    async def trash_drive_file_tool(
-        user_google_email: str,
-        file_id: str,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="trash_drive_file_tool",
+        impl=trash_drive_file,
+        params=(
+            ("user_google_email", str),
+            ("file_id", str),
+        ),
+        doc="""
         Move a file to trash in Google Drive (recoverable).
 
         Args:
             user_google_email: The user's Google email address
             file_id: The file ID to trash
-        """
-        return await trash_drive_file(
-            user_google_email=user_google_email,
-            file_id=file_id,
-        )
-
-    @mcp.tool()
-    async def share_drive_file_tool(
-        user_google_email: str,
-        file_id: str,
-        email: str,
-        role: str = "reader",
-        send_notification: bool = True,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="share_drive_file_tool",
+        impl=share_drive_file,
+        params=(
+            ("user_google_email", str),
+            (
+                "file_id",
+                str,
+            ),
+            ("email", str),
+            ("role", str, "reader"),
+            ("send_notification", bool, True),
+        ),
+        doc="""
         Share a file or folder with a user.
 
         Args:
@@ -337,84 +419,89 @@ def register_workspace_tools(mcp):
             email: Email address of the user to share with
             role: Permission role - "reader", "writer", "commenter", or "owner"
             send_notification: Whether to send an email notification (default: True)
-        """
-        return await share_drive_file(
-            user_google_email=user_google_email,
-            file_id=file_id,
-            email=email,
-            role=role,
-            send_notification=send_notification,
-        )
-
-    @mcp.tool()
-    async def list_drive_permissions_tool(
-        user_google_email: str,
-        file_id: str,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="list_drive_permissions_tool",
+        impl=list_drive_permissions,
+        params=(
+            ("user_google_email", str),
+            ("file_id", str),
+        ),
+        doc="""
         List all permissions on a file or folder.
 
         Args:
             user_google_email: The user's Google email address
             file_id: The file or folder ID
-        """
-        return await list_drive_permissions(
-            user_google_email=user_google_email,
-            file_id=file_id,
-        )
-
-    @mcp.tool()
-    async def remove_drive_permission_tool(
-        user_google_email: str,
-        file_id: str,
-        permission_id: str,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="remove_drive_permission_tool",
+        impl=remove_drive_permission,
+        params=(
+            ("user_google_email", str),
+            ("file_id", str),
+            ("permission_id", str),
+        ),
+        doc="""
         Remove a permission from a file or folder.
 
         Args:
             user_google_email: The user's Google email address
             file_id: The file or folder ID
             permission_id: The permission ID to remove (from list_drive_permissions)
-        """
-        return await remove_drive_permission(
-            user_google_email=user_google_email,
-            file_id=file_id,
-            permission_id=permission_id,
-        )
-
-    # ========================================================================
-    # Sheets Tools
-    # ========================================================================
-
-    @mcp.tool()
-    async def list_spreadsheets_tool(
-        user_google_email: str,
-        query: str = "",
-        page_size: int = 20,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="remove_drive_permissions_bulk_tool",
+        impl=remove_drive_permissions_bulk,
+        params=(
+            ("user_google_email", str),
+            ("file_id", str),
+            ("permission_ids", list),
+        ),
+        doc="""
+        Remove several permissions from a file or folder at once.
+
+        Prefer this over calling remove_drive_permission_tool once per permission.
+
+        Args:
+            user_google_email: The user's Google email address
+            file_id: The file or folder ID
+            permission_ids: List of permission IDs to remove (from list_drive_permissions)
+        """,
+    ),
+    # Sheets
+    ToolSpec(
+        name="list_spreadsheets_tool",
+        impl=list_spreadsheets,
+        params=(
+            ("user_google_email", str),
+            ("query", str, ""),
+            ("page_size", int, 20),
+        ),
+        doc="""
         List Google Sheets spreadsheets in Drive.
 
         Args:
             user_google_email: The user's Google email address
             query: Optional search query to filter spreadsheets
             page_size: Maximum number of spreadsheets to return (default: 20)
-        """
-        return await list_spreadsheets(
-            user_google_email=user_google_email,
-            query=query,
-            page_size=page_size,
-        )
-
-    @mcp.tool()
-    async def get_sheet_values_tool(
-        user_google_email: str,
-        spreadsheet_id: str,
-        range: str = "Sheet1",
-        value_render: str = "FORMATTED_VALUE",
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="get_sheet_values_tool",
+        impl=get_sheet_values,
+        params=(
+            ("user_google_email", str),
+            ("spreadsheet_id", str),
+            ("range", str, "Sheet1"),
+            ("value_render", str, "FORMATTED_VALUE"),
+            ("fields", str, ""),
+        ),
+        optional=("fields",),
+        doc="""
         Get values from a Google Sheet.
 
         Args:
@@ -422,23 +509,20 @@ def register_workspace_tools(mcp):
             spreadsheet_id: The spreadsheet ID
             range: A1 notation range (e.g., "Sheet1!A1:D10" or just "Sheet1")
             value_render: How values should be rendered - "FORMATTED_VALUE", "UNFORMATTED_VALUE", or "FORMULA"
-        """
-        return await get_sheet_values(
-            user_google_email=user_google_email,
-            spreadsheet_id=spreadsheet_id,
-            range=range,
-            value_render=value_render,
-        )
-
-    @mcp.tool()
-    async def update_sheet_values_tool(
-        user_google_email: str,
-        spreadsheet_id: str,
-        range: str,
-        values: list,
-        value_input: str = "USER_ENTERED",
-    ) -> str:
-        """
+            fields: Optional partial-response field mask overriding the default
+        """,
+    ),
+    ToolSpec(
+        name="update_sheet_values_tool",
+        impl=update_sheet_values,
+        params=(
+            ("user_google_email", str),
+            ("spreadsheet_id", str),
+            ("range", str),
+            ("values", list),
+            ("value_input", str, "USER_ENTERED"),
+        ),
+        doc="""
         Update values in a Google Sheet.
 
         Args:
@@ -447,44 +531,36 @@ def register_workspace_tools(mcp):
             range: A1 notation range (e.g., "Sheet1!A1:D10")
             values: 2D array of values to write. Example: [["Header1", "Header2"], ["Value1", "Value2"]]
             value_input: How input values should be interpreted - "USER_ENTERED" or "RAW"
-        """
-        return await update_sheet_values(
-            user_google_email=user_google_email,
-            spreadsheet_id=spreadsheet_id,
-            range=range,
-            values=values,
-            value_input=value_input,
-        )
-
-    @mcp.tool()
-    async def create_spreadsheet_tool(
-        user_google_email: str,
-        title: str,
-        sheet_names: list = None,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="create_spreadsheet_tool",
+        impl=create_spreadsheet,
+        params=(
+            ("user_google_email", str),
+            ("title", str),
+            ("sheet_names", list, None),
+        ),
+        doc="""
         Create a new Google Spreadsheet.
 
         Args:
             user_google_email: The user's Google email address
             title: Title for the new spreadsheet
             sheet_names: Optional list of sheet names to create (default: ["Sheet1"])
-        """
-        return await create_spreadsheet(
-            user_google_email=user_google_email,
-            title=title,
-            sheet_names=sheet_names,
-        )
-
-    @mcp.tool()
-    async def append_sheet_values_tool(
-        user_google_email: str,
-        spreadsheet_id: str,
-        range: str,
-        values: list,
-        value_input: str = "USER_ENTERED",
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="append_sheet_values_tool",
+        impl=append_sheet_values,
+        params=(
+            ("user_google_email", str),
+            ("spreadsheet_id", str),
+            ("range", str),
+            ("values", list),
+            ("value_input", str, "USER_ENTERED"),
+        ),
+        doc="""
         Append values to a Google Sheet (adds rows after existing data).
 
         Args:
@@ -493,56 +569,53 @@ def register_workspace_tools(mcp):
             range: A1 notation range to append to (e.g., "Sheet1!A:D" or "Sheet1")
             values: 2D array of values to append. Example: [["Value1", "Value2"], ["Value3", "Value4"]]
             value_input: How input values should be interpreted - "USER_ENTERED" or "RAW"
-        """
-        return await append_sheet_values(
-            user_google_email=user_google_email,
-            spreadsheet_id=spreadsheet_id,
-            range=range,
-            values=values,
-            value_input=value_input,
-        )
-
-    @mcp.tool()
-    async def get_spreadsheet_metadata_tool(
-        user_google_email: str,
-        spreadsheet_id: str,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="get_spreadsheet_metadata_tool",
+        impl=get_spreadsheet_metadata,
+        params=(
+            ("user_google_email", str),
+            ("spreadsheet_id", str),
+        ),
+        doc="""
         Get metadata about a spreadsheet including all sheet names and properties.
 
         Args:
             user_google_email: The user's Google email address
             spreadsheet_id: The spreadsheet ID
-        """
-        return await get_spreadsheet_metadata(
-            user_google_email=user_google_email,
-            spreadsheet_id=spreadsheet_id,
-        )
-
-    # ========================================================================
-    # Calendar Tools
-    # ========================================================================
-
-    @mcp.tool()
-    async def list_calendars_tool(user_google_email: str) -> str:
-        """
+        """,
+    ),
+    # Calendar
+    ToolSpec(
+        name="list_calendars_tool",
+        impl=list_calendars,
+        params=(
+            ("user_google_email", str),
+            ("fields", str, ""),
+        ),
+        optional=("fields",),
+        doc="""
         List all calendars accessible to the user.
 
         Args:
             user_google_email: The user's Google email address
-        """
-        return await list_calendars(user_google_email=user_google_email)
-
-    @mcp.tool()
-    async def get_events_tool(
-        user_google_email: str,
-        calendar_id: str = "primary",
-        max_results: int = 10,
-        time_min: str = "",
-        time_max: str = "",
-        query: str = "",
-    ) -> str:
-        """
+            fields: Optional partial-response field mask overriding the default
+        """,
+    ),
+    ToolSpec(
+        name="get_events_tool",
+        impl=get_events,
+        params=(
+            ("user_google_email", str),
+            ("calendar_id", str, "primary"),
+            ("max_results", int, 10),
+            ("time_min", str, ""),
+            ("time_max", str, ""),
+            ("query", str, ""),
+        ),
+        optional=("time_min", "time_max", "query"),
+        doc="""
         Get events from a calendar.
 
         Args:
@@ -552,29 +625,24 @@ def register_workspace_tools(mcp):
             time_min: Start time in ISO format (default: now)
             time_max: End time in ISO format (default: 7 days from now)
             query: Optional search query string
-        """
-        return await get_events(
-            user_google_email=user_google_email,
-            calendar_id=calendar_id,
-            max_results=max_results,
-            time_min=time_min if time_min else None,
-            time_max=time_max if time_max else None,
-            query=query if query else None,
-        )
-
-    @mcp.tool()
-    async def create_event_tool(
-        user_google_email: str,
-        summary: str,
-        start_time: str,
-        end_time: str,
-        calendar_id: str = "primary",
-        description: str = "",
-        location: str = "",
-        attendees: str = "",
-        all_day: bool = False,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="create_event_tool",
+        impl=create_event,
+        params=(
+            ("user_google_email", str),
+            ("summary", str),
+            ("start_time", str),
+            ("end_time", str),
+            ("calendar_id", str, "primary"),
+            ("description", str, ""),
+            ("location", str, ""),
+            ("attendees", str, ""),
+            ("all_day", bool, False),
+        ),
+        optional=("description", "location", "attendees"),
+        doc="""
         Create a new calendar event.
 
         Args:
@@ -587,53 +655,49 @@ def register_workspace_tools(mcp):
             location: Optional event location
             attendees: Optional comma-separated list of attendee emails
             all_day: If True, create an all-day event (use date format for start/end)
-        """
-        return await create_event(
-            user_google_email=user_google_email,
-            summary=summary,
-            start_time=start_time,
-            end_time=end_time,
-            calendar_id=calendar_id,
-            description=description if description else None,
-            location=location if location else None,
-            attendees=attendees if attendees else None,
-            all_day=all_day,
-        )
-
-    @mcp.tool()
-    async def delete_event_tool(
-        user_google_email: str,
-        event_id: str,
-        calendar_id: str = "primary",
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="delete_event_tool",
+        impl=delete_event,
+        params=(
+            ("user_google_email", str),
+            ("event_id", str),
+            ("calendar_id", str, "primary"),
+        ),
+        doc="""
         Delete a calendar event.
 
         Args:
             user_google_email: The user's Google email address
             event_id: The event ID to delete
             calendar_id: Calendar ID (default: 'primary')
-        """
-        return await delete_event(
-            user_google_email=user_google_email,
-            event_id=event_id,
-            calendar_id=calendar_id,
-        )
-
-    @mcp.tool()
-    async def update_event_tool(
-        user_google_email: str,
-        event_id: str,
-        calendar_id: str = "primary",
-        summary: str = "",
-        start_time: str = "",
-        end_time: str = "",
-        description: str = "",
-        location: str = "",
-        attendees: str = "",
-        all_day: bool = False,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="update_event_tool",
+        impl=update_event,
+        params=(
+            ("user_google_email", str),
+            ("event_id", str),
+            ("calendar_id", str, "primary"),
+            ("summary", str, ""),
+            ("start_time", str, ""),
+            ("end_time", str, ""),
+            ("description", str, ""),
+            ("location", str, ""),
+            ("attendees", str, ""),
+            ("all_day", bool, False),
+        ),
+        optional=(
+            "summary",
+            "start_time",
+            "end_time",
+            "description",
+            "location",
+            "attendees",
+        ),
+        doc="""
         Update an existing calendar event.
 
         Args:
@@ -647,90 +711,89 @@ def register_workspace_tools(mcp):
             location: New location (optional)
             attendees: New comma-separated list of attendee emails (optional)
             all_day: If True and updating times, use date format
-        """
-        return await update_event(
-            user_google_email=user_google_email,
-            event_id=event_id,
-            calendar_id=calendar_id,
-            summary=summary if summary else None,
-            start_time=start_time if start_time else None,
-            end_time=end_time if end_time else None,
-            description=description if description else None,
-            location=location if location else None,
-            attendees=attendees if attendees else None,
-            all_day=all_day,
-        )
-
-    # ========================================================================
-    # Docs Tools
-    # ========================================================================
-
-    @mcp.tool()
-    async def search_docs_tool(
-        user_google_email: str,
-        query: str,
-        page_size: int = 10,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="delete_events_bulk_tool",
+        impl=delete_events_bulk,
+        params=(
+            ("user_google_email", str),
+            ("event_ids", list),
+            ("calendar_id", str, "primary"),
+        ),
+        doc="""
+        Delete several calendar events at once.
+
+        Prefer this over calling delete_event_tool once per event.
+
+        Args:
+            user_google_email: The user's Google email address
+            event_ids: List of event IDs to delete
+            calendar_id: Calendar ID (default: 'primary')
+        """,
+    ),
+    # Docs
+    ToolSpec(
+        name="search_docs_tool",
+        impl=search_docs,
+        params=(
+            ("user_google_email", str),
+            ("query", str),
+            ("page_size", int, 10),
+        ),
+        doc="""
         Search for Google Docs by name.
 
         Args:
             user_google_email: The user's Google email address
             query: Search query string
             page_size: Maximum number of docs to return (default: 10)
-        """
-        return await search_docs(
-            user_google_email=user_google_email,
-            query=query,
-            page_size=page_size,
-        )
-
-    @mcp.tool()
-    async def get_doc_content_tool(
-        user_google_email: str,
-        document_id: str,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="get_doc_content_tool",
+        impl=get_doc_content,
+        params=(
+            ("user_google_email", str),
+            ("document_id", str),
+        ),
+        doc="""
         Get the content of a Google Doc.
 
         Args:
             user_google_email: The user's Google email address
             document_id: The document ID
-        """
-        return await get_doc_content(
-            user_google_email=user_google_email,
-            document_id=document_id,
-        )
-
-    @mcp.tool()
-    async def create_doc_tool(
-        user_google_email: str,
-        title: str,
-        content: str = "",
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="create_doc_tool",
+        impl=create_doc,
+        params=(
+            ("user_google_email", str),
+            ("title", str),
+            ("content", str, ""),
+        ),
+        doc="""
         Create a new Google Doc.
 
         Args:
             user_google_email: The user's Google email address
             title: Document title
             content: Optional initial content
-        """
-        return await create_doc(
-            user_google_email=user_google_email,
-            title=title,
-            content=content,
-        )
-
-    @mcp.tool()
-    async def modify_doc_text_tool(
-        user_google_email: str,
-        document_id: str,
-        text: str,
-        index: int = 1,
-        replace_text: str = "",
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="modify_doc_text_tool",
+        impl=modify_doc_text,
+        params=(
+            ("user_google_email", str),
+            ("document_id", str),
+            ("text", str),
+            ("index", int, 1),
+            ("replace_text", str, ""),
+        ),
+        optional=("replace_text",),
+        doc="""
         Modify text in a Google Doc.
 
         Args:
@@ -739,31 +802,34 @@ def register_workspace_tools(mcp):
             text: Text to insert (or replace with)
             index: Position to insert text (default: 1, start of document)
             replace_text: If provided, find and replace this text with 'text'
-        """
-        return await modify_doc_text(
-            user_google_email=user_google_email,
-            document_id=document_id,
-            text=text,
-            index=index,
-            replace_text=replace_text if replace_text else None,
-        )
-
-    @mcp.tool()
-    async def append_doc_text_tool(
-        user_google_email: str,
-        document_id: str,
-        text: str,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="append_doc_text_tool",
+        impl=append_doc_text,
+        params=(
+            ("user_google_email", str),
+            ("document_id", str),
+            ("text", str),
+        ),
+        doc="""
         Append text to the end of a Google Doc.
 
         Args:
             user_google_email: The user's Google email address
             document_id: The document ID
             text: Text to append to the end of the document
-        """
-        return await append_doc_text(
-            user_google_email=user_google_email,
-            document_id=document_id,
-            text=text,
-        )
+        """,
+    ),
+)
+
+
+def _workspace_tools() -> tuple:
+    """Build a fresh Tool per spec, so servers never share mutable tool state."""
+    return tuple(Tool.from_function(_make_wrapper(spec)) for spec in _WORKSPACE_TOOLS)
+
+
+def register_workspace_tools(mcp):
+    """Register Google Workspace tools with the MCP server."""
+    for tool in _workspace_tools():
+        mcp.add_tool(tool)
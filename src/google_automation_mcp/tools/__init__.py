@@ -21,6 +21,7 @@ from .gmail import (
     send_gmail_message,
     list_gmail_labels,
     modify_gmail_labels,
+    modify_gmail_labels_bulk,
 )
 
 # Drive tools
@@ -35,6 +36,7 @@ from .drive import (
     share_drive_file,
     list_drive_permissions,
     remove_drive_permission,
+    remove_drive_permissions_bulk,
 )
 
 # Sheets tools
@@ -54,6 +56,7 @@ from .calendar import (
     create_event,
     delete_event,
     update_event,
+    delete_events_bulk,
 )
 
 # Docs tools
@@ -67,9 +70,8 @@ from .docs import (
 
 
 # Lazy imports for Apps Script tools to avoid circular imports
-def __getattr__(name):
-    """Lazy import Apps Script tools to avoid circular dependencies."""
-    _appscript_tools = [
+_APPSCRIPT_TOOLS = frozenset(
+    {
         "list_script_projects",
         "get_script_project",
         "get_script_content",
@@ -86,12 +88,21 @@ def __getattr__(name):
         "get_version",
         "list_script_processes",
         "get_script_metrics",
-    ]
-    if name in _appscript_tools:
-        from .. import appscript_tools
+    }
+)
+
+
+def __getattr__(name):
+    """Lazy import Apps Script tools to avoid circular dependencies."""
+    if name not in _APPSCRIPT_TOOLS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from .. import appscript_tools
 
-        return getattr(appscript_tools, name)
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache in module globals so later lookups skip __getattr__ entirely
+    value = getattr(appscript_tools, name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -125,6 +136,7 @@ __all__ = [
     "send_gmail_message",
     "list_gmail_labels",
     "modify_gmail_labels",
+    "modify_gmail_labels_bulk",
     # Drive
     "search_drive_files",
     "list_drive_items",
@@ -136,6 +148,7 @@ __all__ = [
     "share_drive_file",
     "list_drive_permissions",
     "remove_drive_permission",
+    "remove_drive_permissions_bulk",
     # Sheets
     "list_spreadsheets",
     "get_sheet_values",
@@ -149,6 +162,7 @@ __all__ = [
     "create_event",
     "delete_event",
     "update_event",
+    "delete_events_bulk",
     # Docs
     "search_docs",
     "get_doc_content",
@@ -4,12 +4,34 @@ Google Authentication Tools
 Provides OAuth authentication helpers for the MCP server.
 """
 
+import asyncio
+import re
+from urllib.parse import unquote_plus
+
 from ..auth import (
     start_auth_flow,
     complete_auth_flow,
     set_pending_flow,
     get_pending_flow,
     clear_pending_flow,
+    verify_id_token,
+)
+
+# First "code" or "error" query parameter of an OAuth redirect URL
+_REDIRECT_RE = re.compile(r"[?&](?P<key>code|error)=(?P<value>[^&#]*)")
+
+# Instructions returned by start_google_auth; the literals are joined at
+# compile time, leaving a single substitution per call
+_AUTH_INSTRUCTIONS = (
+    "Google OAuth Authentication\n"
+    "============================\n\n"
+    "1. Open this URL in your browser:\n\n"
+    "   {auth_url}\n\n"
+    "2. Sign in and authorize the application\n\n"
+    "3. You will be redirected to http://localhost (page will not load)\n\n"
+    "4. Copy the FULL URL from your browser address bar\n"
+    "   (looks like: http://localhost/?code=4/0A...&scope=...)\n\n"
+    "5. Call complete_google_auth with the redirect URL"
 )
 
 
@@ -27,17 +49,7 @@ async def start_google_auth() -> str:
         auth_url, flow = start_auth_flow()
         set_pending_flow(flow)
 
-        return (
-            "Google OAuth Authentication\n"
-            "============================\n\n"
-            "1. Open this URL in your browser:\n\n"
-            f"   {auth_url}\n\n"
-            "2. Sign in and authorize the application\n\n"
-            "3. You will be redirected to http://localhost (page will not load)\n\n"
-            "4. Copy the FULL URL from your browser address bar\n"
-            "   (looks like: http://localhost/?code=4/0A...&scope=...)\n\n"
-            "5. Call complete_google_auth with the redirect URL"
-        )
+        return _AUTH_INSTRUCTIONS.format(auth_url=auth_url)
     except FileNotFoundError as e:
         return str(e)
     except Exception as e:
@@ -58,17 +70,28 @@ async def complete_google_auth(redirect_url: str) -> str:
     if flow is None:
         return "No pending authentication flow. Please run start_google_auth first."
 
+    # Reject malformed URLs before spending a token exchange; the pending flow
+    # is kept so the user can retry with the correct URL
+    match = _REDIRECT_RE.search(redirect_url)
+    if match is None or not match.group("value"):
+        return (
+            "The redirect URL does not contain an authorization code.\n\n"
+            "Copy the FULL URL from your browser address bar "
+            "(looks like: http://localhost/?code=4/0A...&scope=...)."
+        )
+    if match.group("key") == "error":
+        clear_pending_flow()
+        error = unquote_plus(match.group("value"))
+        return f"Authorization was denied: {error}\n\nPlease run start_google_auth to try again."
+
     try:
-        creds = complete_auth_flow(flow, redirect_url)
+        creds = await asyncio.to_thread(complete_auth_flow, flow, redirect_url)
         clear_pending_flow()
 
         # Get user email to confirm
         try:
-            from google.oauth2 import id_token
-            from google.auth.transport import requests
-
-            info = id_token.verify_oauth2_token(
-                creds.id_token, requests.Request(), creds.client_id
+            info = await asyncio.to_thread(
+                verify_id_token, creds.id_token, creds.client_id
             )
             email = info.get("email", "unknown")
         except Exception:
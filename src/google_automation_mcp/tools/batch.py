@@ -0,0 +1,226 @@
+"""
+Batch Request Coalescing
+
+Collects Google API requests issued within a short window and sends them to
+the API's batch endpoint as a single multipart/mixed POST, so bulk edits
+(label changes, permission removals, event deletes) share one round trip.
+
+Requests are grouped by (service name, user): a batch must target a single
+API and is executed with a single set of credentials.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.context import set_rate_limit_key
+from ..core.ratelimit import acquire_rate_limit
+from .concurrency import run_blocking
+
+logger = logging.getLogger(__name__)
+
+# Google caps batches at 100 sub-requests (50 for Calendar)
+DEFAULT_MAX_BATCH = 50
+DEFAULT_MAX_WAIT_MS = 10
+
+
+class BatchCoalescer:
+    """
+    Coalesces concurrent Google API requests into batch HTTP requests.
+
+    Callers await submit() with an unexecuted HttpRequest. A background task
+    waits up to max_wait_ms after the first pending request, drains up to
+    max_batch entries, and executes one BatchHttpRequest per group. A group
+    with a single entry is executed directly, since a batch of one only adds
+    multipart overhead.
+    """
+
+    def __init__(
+        self,
+        max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        """
+        Initialize the coalescer.
+
+        Args:
+            max_wait_ms: How long to wait for more requests before flushing
+            max_batch: Maximum number of requests per flush
+        """
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: set = set()
+
+    async def submit(
+        self, service_name: str, user_google_email: str, service, request
+    ) -> Any:
+        """
+        Queue a request for batched execution and wait for its response.
+
+        Args:
+            service_name: API service name (e.g., "gmail", "drive")
+            user_google_email: The user the request is executed for
+            service: The Google API service the request was built from
+            request: The unexecuted HttpRequest
+
+        Returns:
+            The deserialized response, as request.execute() would return it
+
+        Raises:
+            HttpError if the sub-request failed
+        """
+        # Each sub-request counts against the user's quota, so pace submissions
+        # here; the batch itself is then executed without further limiting
+        await acquire_rate_limit(service_name, user_google_email)
+
+        loop = asyncio.get_running_loop()
+        self._ensure_worker(loop)
+
+        future = loop.create_future()
+        key = (service_name, user_google_email)
+        self._queue.put_nowait((key, service, request, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop the background task, failing any requests it had not sent."""
+        worker, self._worker = self._worker, None
+        if worker is None or worker.done():
+            return
+
+        worker.cancel()
+        if worker.get_loop() is asyncio.get_running_loop():
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+    def _ensure_worker(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the background task, restarting it if the event loop changed."""
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Drain the queue in windows of max_wait and dispatch each group."""
+        queue = self._queue
+
+        # The worker inherits the context of whichever tool call started it;
+        # clear its rate limit key since requests were paced in submit()
+        set_rate_limit_key(None)
+
+        entries: List[tuple] = []
+        try:
+            while True:
+                entries = [await queue.get()]
+                if queue.qsize() < self.max_batch - 1:
+                    await asyncio.sleep(self.max_wait)
+
+                while len(entries) < self.max_batch and not queue.empty():
+                    entries.append(queue.get_nowait())
+
+                self._flush(entries)
+                entries = []
+        except asyncio.CancelledError:
+            # Nothing will drain the queue any more, so fail whatever is left
+            # rather than leave its callers waiting forever
+            while not queue.empty():
+                entries.append(queue.get_nowait())
+            for _, _, _, future in entries:
+                _set_exception(future, RuntimeError("Batch coalescer was closed"))
+            raise
+
+    def _flush(self, entries: List[tuple]) -> None:
+        """Group drained entries by (service, user) and dispatch each group."""
+        groups: Dict[Tuple[str, str], List[tuple]] = {}
+        for entry in entries:
+            groups.setdefault(entry[0], []).append(entry)
+
+        for group in groups.values():
+            task = asyncio.create_task(self._dispatch(group))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, entries: List[tuple]) -> None:
+        """Execute a group of requests and resolve their futures."""
+        if len(entries) == 1:
+            _, _, request, future = entries[0]
+            try:
+                result = await run_blocking(request.execute)
+            except Exception as e:
+                _set_exception(future, e)
+            else:
+                _set_result(future, result)
+            return
+
+        key, service = entries[0][0], entries[0][1]
+        logger.debug(f"[batch] Executing {len(entries)} requests for {key}")
+
+        responses: Dict[str, Tuple[Any, Optional[Exception]]] = {}
+
+        def callback(request_id, response, exception):
+            responses[request_id] = (response, exception)
+
+        try:
+            batch = service.new_batch_http_request(callback=callback)
+            for i, (_, _, request, _) in enumerate(entries):
+                batch.add(request, request_id=str(i))
+
+            await run_blocking(batch.execute)
+        except Exception as e:
+            for _, _, _, future in entries:
+                _set_exception(future, e)
+            return
+
+        for i, (_, _, request, future) in enumerate(entries):
+            if str(i) not in responses:
+                # Resolving with None would surface later as a confusing
+                # AttributeError in the caller
+                uri = getattr(request, "uri", request)
+                _set_exception(
+                    future, RuntimeError(f"No response for batched request {i} ({uri})")
+                )
+                continue
+
+            response, exception = responses[str(i)]
+            if exception is not None:
+                _set_exception(future, exception)
+            else:
+                _set_result(future, response)
+
+
+def _set_result(future: asyncio.Future, result: Any) -> None:
+    """Resolve a future unless the caller has already given up on it."""
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, exception: Exception) -> None:
+    """Fail a future unless the caller has already given up on it."""
+    if not future.done():
+        future.set_exception(exception)
+
+
+# =============================================================================
+# Global Coalescer Instance
+# =============================================================================
+
+_batch_coalescer: Optional[BatchCoalescer] = None
+
+
+def get_batch_coalescer() -> BatchCoalescer:
+    """
+    Get the global batch coalescer instance.
+
+    Returns:
+        Shared BatchCoalescer used by all tool modules
+    """
+    global _batch_coalescer
+
+    if _batch_coalescer is None:
+        _batch_coalescer = BatchCoalescer()
+
+    return _batch_coalescer
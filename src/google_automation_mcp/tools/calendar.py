@@ -12,32 +12,42 @@ Licensed under MIT License.
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional
 
 from ..auth.service_adapter import with_calendar_service
+from .batch import get_batch_coalescer
+from .concurrency import run_blocking
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
+# Partial-response masks: request only the fields the formatters read
+CALENDAR_LIST_FIELDS = "items(id,summary,primary,accessRole)"
+EVENT_LIST_FIELDS = "items(id,summary,location,start,end,htmlLink)"
+
 
 @handle_errors
 @with_calendar_service
 async def list_calendars(
     service,
     user_google_email: str,
+    fields: Optional[str] = None,
 ) -> str:
     """
     List all calendars accessible to the user.
 
     Args:
         user_google_email: The user's Google email address
+        fields: Optional field mask for the response (default: CALENDAR_LIST_FIELDS)
 
     Returns:
         str: Formatted list of calendars
     """
     logger.info(f"[list_calendars] User: {user_google_email}")
 
-    response = await asyncio.to_thread(service.calendarList().list().execute)
+    response = await run_blocking(
+        service.calendarList().list(fields=fields or CALENDAR_LIST_FIELDS).execute
+    )
 
     calendars = response.get("items", [])
     if not calendars:
@@ -97,12 +107,13 @@ async def get_events(
         "maxResults": max_results,
         "singleEvents": True,
         "orderBy": "startTime",
+        "fields": EVENT_LIST_FIELDS,
     }
 
     if query:
         request_params["q"] = query
 
-    response = await asyncio.to_thread(service.events().list(**request_params).execute)
+    response = await run_blocking(service.events().list(**request_params).execute)
 
     events = response.get("items", [])
     if not events:
@@ -198,7 +209,7 @@ async def create_event(
         attendee_list = [email.strip() for email in attendees.split(",")]
         event_body["attendees"] = [{"email": email} for email in attendee_list]
 
-    created_event = await asyncio.to_thread(
+    created_event = await run_blocking(
         service.events().insert(calendarId=calendar_id, body=event_body).execute
     )
 
@@ -241,8 +252,11 @@ async def delete_event(
     """
     logger.info(f"[delete_event] User: {user_google_email}, Event: {event_id}")
 
-    await asyncio.to_thread(
-        service.events().delete(calendarId=calendar_id, eventId=event_id).execute
+    await get_batch_coalescer().submit(
+        "calendar",
+        user_google_email,
+        service,
+        service.events().delete(calendarId=calendar_id, eventId=event_id),
     )
 
     return f"Deleted event: {event_id} from calendar: {calendar_id}"
@@ -312,10 +326,13 @@ async def update_event(
     if not patch_body:
         return "No fields to update. Provide at least one field to modify."
 
-    updated_event = await asyncio.to_thread(
-        service.events()
-        .patch(calendarId=calendar_id, eventId=event_id, body=patch_body)
-        .execute
+    updated_event = await get_batch_coalescer().submit(
+        "calendar",
+        user_google_email,
+        service,
+        service.events().patch(
+            calendarId=calendar_id, eventId=event_id, body=patch_body
+        ),
     )
 
     output = [
@@ -334,3 +351,61 @@ async def update_event(
         output.append(f"Link: {updated_event.get('htmlLink')}")
 
     return "\n".join(output)
+
+
+@handle_errors
+@with_calendar_service
+async def delete_events_bulk(
+    service,
+    user_google_email: str,
+    event_ids: List[str],
+    calendar_id: str = "primary",
+) -> str:
+    """
+    Delete multiple calendar events.
+
+    The deletions are issued concurrently and sent as a single batch request.
+
+    Args:
+        user_google_email: The user's Google email address
+        event_ids: The event IDs to delete
+        calendar_id: Calendar ID (default: 'primary')
+
+    Returns:
+        str: Summary of deleted and failed events
+    """
+    logger.info(
+        f"[delete_events_bulk] User: {user_google_email}, Events: {len(event_ids)}"
+    )
+
+    if not event_ids:
+        return "No events to delete. Provide event_ids."
+
+    coalescer = get_batch_coalescer()
+    results = await asyncio.gather(
+        *(
+            coalescer.submit(
+                "calendar",
+                user_google_email,
+                service,
+                service.events().delete(calendarId=calendar_id, eventId=event_id),
+            )
+            for event_id in event_ids
+        ),
+        return_exceptions=True,
+    )
+
+    failed = [
+        (event_id, result)
+        for event_id, result in zip(event_ids, results)
+        if isinstance(result, BaseException)
+    ]
+
+    output = [
+        f"Deleted {len(event_ids) - len(failed)} of {len(event_ids)} events "
+        f"from calendar: {calendar_id}"
+    ]
+    for event_id, error in failed:
+        output.append(f"  - Failed: {event_id} ({error})")
+
+    return "\n".join(output)
@@ -0,0 +1,58 @@
+"""
+Bounded Concurrency for Blocking Google API Calls
+
+googleapiclient is synchronous, so tools run each API call in a worker thread.
+A per-loop semaphore caps how many calls are in flight at once, letting
+concurrent tool invocations overlap without bursting past Google's per-user
+quotas or exhausting the thread pool.
+"""
+
+import asyncio
+import weakref
+from typing import Any, Callable
+
+from ..core.context import get_rate_limit_key
+from ..core.ratelimit import acquire_rate_limit
+
+# Maximum number of Google API calls in flight at once
+MAX_CONCURRENT_REQUESTS = 16
+
+# Size of the default executor installed by the server lifespan; leaves
+# headroom above MAX_CONCURRENT_REQUESTS for credential loads and batches
+MAX_WORKER_THREADS = 32
+
+# Event loop -> Semaphore; asyncio primitives must not be shared across loops
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Get the request semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking Google API call in a worker thread.
+
+    Inside a service-decorated tool, first waits for that service's per-user
+    rate limit.
+
+    Args:
+        func: Blocking callable, typically an HttpRequest's execute method
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The return value of func
+    """
+    key = get_rate_limit_key()
+    if key is not None:
+        await acquire_rate_limit(*key)
+
+    async with _get_semaphore():
+        return await asyncio.to_thread(func, *args, **kwargs)
@@ -9,11 +9,11 @@ Original: gdocs/docs_tools.py
 Licensed under MIT License.
 """
 
-import asyncio
 import logging
 from typing import Optional
 
 from ..auth.service_adapter import with_docs_service, with_drive_service
+from .concurrency import run_blocking
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
@@ -43,7 +43,7 @@ async def search_docs(
     escaped_query = query.replace("'", "\\'")
     final_query = f"name contains '{escaped_query}' and mimeType='application/vnd.google-apps.document' and trashed=false"
 
-    results = await asyncio.to_thread(
+    results = await run_blocking(
         service.files()
         .list(
             q=final_query,
@@ -89,9 +89,7 @@ async def get_doc_content(
     """
     logger.info(f"[get_doc_content] User: {user_google_email}, Doc: {document_id}")
 
-    doc = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc = await run_blocking(service.documents().get(documentId=document_id).execute)
 
     title = doc.get("title", "Untitled")
 
@@ -147,9 +145,7 @@ async def create_doc(
     """
     logger.info(f"[create_doc] User: {user_google_email}, Title: {title}")
 
-    doc = await asyncio.to_thread(
-        service.documents().create(body={"title": title}).execute
-    )
+    doc = await run_blocking(service.documents().create(body={"title": title}).execute)
 
     document_id = doc.get("documentId")
 
@@ -163,7 +159,7 @@ async def create_doc(
                 }
             }
         ]
-        await asyncio.to_thread(
+        await run_blocking(
             service.documents()
             .batchUpdate(documentId=document_id, body={"requests": requests})
             .execute
@@ -226,7 +222,7 @@ async def modify_doc_text(
             }
         )
 
-    result = await asyncio.to_thread(
+    result = await run_blocking(
         service.documents()
         .batchUpdate(documentId=document_id, body={"requests": requests})
         .execute
@@ -273,9 +269,7 @@ async def append_doc_text(
     logger.info(f"[append_doc_text] User: {user_google_email}, Doc: {document_id}")
 
     # First get the document to find the end index
-    doc = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc = await run_blocking(service.documents().get(documentId=document_id).execute)
 
     # Get the end index of the document body
     body = doc.get("body", {})
@@ -299,7 +293,7 @@ async def append_doc_text(
         }
     ]
 
-    await asyncio.to_thread(
+    await run_blocking(
         service.documents()
         .batchUpdate(documentId=document_id, body={"requests": requests})
         .execute
@@ -12,14 +12,25 @@ Licensed under MIT License.
 import asyncio
 import io
 import logging
+from typing import List, Optional
 
 from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
 
 from ..auth.service_adapter import with_drive_service
+from .batch import get_batch_coalescer
+from .concurrency import run_blocking
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
+# Partial-response mask for file listings
+FILE_LIST_FIELDS = "files(id, name, mimeType, size, modifiedTime, webViewLink)"
+
+# File content is downloaded in chunks and capped, so large files don't have to
+# be held in memory in full
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_CONTENT_BYTES = 10 * 1024 * 1024
+
 
 @handle_errors
 @with_drive_service
@@ -29,6 +40,7 @@ async def search_drive_files(
     query: str,
     page_size: int = 10,
     include_shared_drives: bool = True,
+    fields: Optional[str] = None,
 ) -> str:
     """
     Search for files and folders in Google Drive.
@@ -42,6 +54,7 @@ async def search_drive_files(
                - modifiedTime > '2024-01-01'
         page_size: Maximum number of files to return (default: 10)
         include_shared_drives: Whether to include shared drive items (default: True)
+        fields: Optional field mask for the response (default: FILE_LIST_FIELDS)
 
     Returns:
         str: Formatted list of matching files
@@ -59,12 +72,12 @@ async def search_drive_files(
         escaped_query = query.replace("'", "\\'")
         final_query = f"fullText contains '{escaped_query}'"
 
-    results = await asyncio.to_thread(
+    results = await run_blocking(
         service.files()
         .list(
             q=final_query,
             pageSize=page_size,
-            fields="files(id, name, mimeType, size, modifiedTime, webViewLink)",
+            fields=fields or FILE_LIST_FIELDS,
             supportsAllDrives=include_shared_drives,
             includeItemsFromAllDrives=include_shared_drives,
         )
@@ -96,6 +109,7 @@ async def list_drive_items(
     folder_id: str = "root",
     page_size: int = 50,
     include_shared_drives: bool = True,
+    fields: Optional[str] = None,
 ) -> str:
     """
     List files and folders in a Drive folder.
@@ -105,6 +119,7 @@ async def list_drive_items(
         folder_id: The folder ID to list (default: 'root' for My Drive root)
         page_size: Maximum number of items to return (default: 50)
         include_shared_drives: Whether to include shared drive items (default: True)
+        fields: Optional field mask for the response (default: FILE_LIST_FIELDS)
 
     Returns:
         str: Formatted list of items in the folder
@@ -113,12 +128,12 @@ async def list_drive_items(
 
     query = f"'{folder_id}' in parents and trashed=false"
 
-    results = await asyncio.to_thread(
+    results = await run_blocking(
         service.files()
         .list(
             q=query,
             pageSize=page_size,
-            fields="files(id, name, mimeType, size, modifiedTime, webViewLink)",
+            fields=fields or FILE_LIST_FIELDS,
             supportsAllDrives=include_shared_drives,
             includeItemsFromAllDrives=include_shared_drives,
             orderBy="folder,name",
@@ -160,6 +175,7 @@ async def get_drive_file_content(
     service,
     user_google_email: str,
     file_id: str,
+    max_bytes: int = DEFAULT_MAX_CONTENT_BYTES,
 ) -> str:
     """
     Get the content of a Google Drive file.
@@ -170,17 +186,27 @@ async def get_drive_file_content(
     - Google Slides → exported as plain text
     - Other files → direct download (text files)
 
+    Direct downloads are fetched in chunks and stop once max_bytes have been
+    received. Google native files are exported whole (the export endpoint
+    ignores Range, and Google caps exports at 10 MB); only the returned text
+    is trimmed to max_bytes.
+
     Args:
         user_google_email: The user's Google email address
         file_id: The Drive file ID
+        max_bytes: Maximum number of bytes of content to return (default: 10 MB);
+                   longer content is truncated
 
     Returns:
         str: File content with metadata header
     """
     logger.info(f"[get_drive_file_content] User: {user_google_email}, File: {file_id}")
 
+    if max_bytes < 1:
+        return "max_bytes must be at least 1."
+
     # Get file metadata
-    file_metadata = await asyncio.to_thread(
+    file_metadata = await run_blocking(
         service.files()
         .get(
             fileId=file_id,
@@ -208,18 +234,35 @@ async def get_drive_file_content(
         request_obj = service.files().get_media(fileId=file_id)
 
     fh = io.BytesIO()
-    downloader = MediaIoBaseDownload(fh, request_obj)
+    downloader = MediaIoBaseDownload(
+        fh, request_obj, chunksize=min(DOWNLOAD_CHUNK_SIZE, max_bytes)
+    )
 
+    # Stop fetching chunks once max_bytes have been downloaded
     done = False
+    truncated = False
     while not done:
-        _, done = await asyncio.to_thread(downloader.next_chunk)
-
+        _, done = await run_blocking(downloader.next_chunk)
+        if not done and fh.tell() >= max_bytes:
+            truncated = True
+            break
+
+    if fh.tell() > max_bytes:
+        fh.truncate(max_bytes)
+        truncated = True
     content_bytes = fh.getvalue()
 
     try:
         body_text = content_bytes.decode("utf-8")
-    except UnicodeDecodeError:
-        body_text = f"[Binary file - {len(content_bytes)} bytes]"
+    except UnicodeDecodeError as e:
+        # A truncated download can end in the middle of a multi-byte character
+        if truncated and e.start >= len(content_bytes) - 3:
+            body_text = content_bytes[: e.start].decode("utf-8")
+        else:
+            body_text = f"[Binary file - {len(content_bytes)} bytes]"
+
+    if truncated:
+        body_text += f"\n\n[Content truncated at {max_bytes} bytes]"
 
     header = (
         f'File: "{file_name}" (ID: {file_id})\n'
@@ -269,7 +312,7 @@ async def create_drive_file(
             resumable=True,
         )
 
-        created_file = await asyncio.to_thread(
+        created_file = await run_blocking(
             service.files()
             .create(
                 body=file_metadata,
@@ -280,7 +323,7 @@ async def create_drive_file(
             .execute
         )
     else:
-        created_file = await asyncio.to_thread(
+        created_file = await run_blocking(
             service.files()
             .create(
                 body=file_metadata,
@@ -324,7 +367,7 @@ async def create_drive_folder(
         "parents": [parent_id],
     }
 
-    created_folder = await asyncio.to_thread(
+    created_folder = await run_blocking(
         service.files()
         .create(
             body=file_metadata,
@@ -362,7 +405,7 @@ async def delete_drive_file(
     """
     logger.info(f"[delete_drive_file] User: {user_google_email}, File: {file_id}")
 
-    await asyncio.to_thread(
+    await run_blocking(
         service.files().delete(fileId=file_id, supportsAllDrives=True).execute
     )
 
@@ -388,7 +431,7 @@ async def trash_drive_file(
     """
     logger.info(f"[trash_drive_file] User: {user_google_email}, File: {file_id}")
 
-    await asyncio.to_thread(
+    await run_blocking(
         service.files()
         .update(fileId=file_id, body={"trashed": True}, supportsAllDrives=True)
         .execute
@@ -430,15 +473,16 @@ async def share_drive_file(
         "emailAddress": email,
     }
 
-    result = await asyncio.to_thread(
-        service.permissions()
-        .create(
+    result = await get_batch_coalescer().submit(
+        "drive",
+        user_google_email,
+        service,
+        service.permissions().create(
             fileId=file_id,
             body=permission,
             sendNotificationEmail=send_notification,
             supportsAllDrives=True,
-        )
-        .execute
+        ),
     )
 
     return (
@@ -468,7 +512,7 @@ async def list_drive_permissions(
     """
     logger.info(f"[list_drive_permissions] User: {user_google_email}, File: {file_id}")
 
-    result = await asyncio.to_thread(
+    result = await run_blocking(
         service.permissions()
         .list(
             fileId=file_id,
@@ -524,10 +568,73 @@ async def remove_drive_permission(
         f"[remove_drive_permission] User: {user_google_email}, File: {file_id}, Permission: {permission_id}"
     )
 
-    await asyncio.to_thread(
-        service.permissions()
-        .delete(fileId=file_id, permissionId=permission_id, supportsAllDrives=True)
-        .execute
+    await get_batch_coalescer().submit(
+        "drive",
+        user_google_email,
+        service,
+        service.permissions().delete(
+            fileId=file_id, permissionId=permission_id, supportsAllDrives=True
+        ),
     )
 
     return f"Removed permission {permission_id} from file {file_id}"
+
+
+@handle_errors
+@with_drive_service
+async def remove_drive_permissions_bulk(
+    service,
+    user_google_email: str,
+    file_id: str,
+    permission_ids: List[str],
+) -> str:
+    """
+    Remove multiple permissions from a file or folder.
+
+    The removals are issued concurrently and sent as a single batch request.
+
+    Args:
+        user_google_email: The user's Google email address
+        file_id: The file or folder ID
+        permission_ids: The permission IDs to remove (from list_drive_permissions)
+
+    Returns:
+        str: Summary of removed and failed permissions
+    """
+    logger.info(
+        f"[remove_drive_permissions_bulk] User: {user_google_email}, File: {file_id}, Permissions: {len(permission_ids)}"
+    )
+
+    if not permission_ids:
+        return "No permissions to remove. Provide permission_ids."
+
+    coalescer = get_batch_coalescer()
+    results = await asyncio.gather(
+        *(
+            coalescer.submit(
+                "drive",
+                user_google_email,
+                service,
+                service.permissions().delete(
+                    fileId=file_id, permissionId=permission_id, supportsAllDrives=True
+                ),
+            )
+            for permission_id in permission_ids
+        ),
+        return_exceptions=True,
+    )
+
+    failed = [
+        (permission_id, result)
+        for permission_id, result in zip(permission_ids, results)
+        if isinstance(result, BaseException)
+    ]
+
+    output = [
+        f"Removed {len(permission_ids) - len(failed)} of {len(permission_ids)} "
+        f"permissions from file {file_id}"
+    ]
+    for permission_id, error in failed:
+        output.append(f"  - Failed: {permission_id} ({error})")
+
+    return "\n".join(output)
@@ -17,10 +17,21 @@ from email.mime.multipart import MIMEMultipart
 from typing import Optional, List
 
 from ..auth.service_adapter import with_gmail_service
+from .batch import get_batch_coalescer
+from .concurrency import run_blocking
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
+# Partial-response masks: request only the fields the formatters read
+SEARCH_FIELDS = "messages(id,threadId),nextPageToken"
+MESSAGE_METADATA_FIELDS = "id,snippet,payload/headers"
+MESSAGE_FIELDS = "id,payload(headers,body/data,parts(mimeType,body/data))"
+LABEL_FIELDS = "labels(id,name,type)"
+
+# users.messages.batchModify accepts at most this many message IDs per call
+BATCH_MODIFY_MAX_IDS = 1000
+
 
 @handle_errors
 @with_gmail_service
@@ -30,6 +41,7 @@ async def search_gmail_messages(
     query: str = "",
     max_results: int = 10,
     label_ids: Optional[List[str]] = None,
+    fields: Optional[str] = None,
 ) -> str:
     """
     Search for Gmail messages matching a query.
@@ -39,6 +51,7 @@ async def search_gmail_messages(
         query: Gmail search query (e.g., "from:user@example.com subject:hello")
         max_results: Maximum number of messages to return (default: 10)
         label_ids: Optional list of label IDs to filter by
+        fields: Optional field mask for the list response (default: SEARCH_FIELDS)
 
     Returns:
         str: Formatted list of matching messages
@@ -48,13 +61,14 @@ async def search_gmail_messages(
     request_params = {
         "userId": "me",
         "maxResults": max_results,
+        "fields": fields or SEARCH_FIELDS,
     }
     if query:
         request_params["q"] = query
     if label_ids:
         request_params["labelIds"] = label_ids
 
-    response = await asyncio.to_thread(
+    response = await run_blocking(
         service.users().messages().list(**request_params).execute
     )
 
@@ -64,20 +78,27 @@ async def search_gmail_messages(
 
     output = [f"Found {len(messages)} messages for '{query}':"]
 
-    # Get details for each message
-    for msg in messages[:max_results]:
-        msg_detail = await asyncio.to_thread(
-            service.users()
-            .messages()
-            .get(
-                userId="me",
-                id=msg["id"],
-                format="metadata",
-                metadataHeaders=["Subject", "From", "Date"],
+    # Fetch details for all messages concurrently
+    messages = messages[:max_results]
+    details = await asyncio.gather(
+        *(
+            run_blocking(
+                service.users()
+                .messages()
+                .get(
+                    userId="me",
+                    id=msg["id"],
+                    format="metadata",
+                    metadataHeaders=["Subject", "From", "Date"],
+                    fields=MESSAGE_METADATA_FIELDS,
+                )
+                .execute
             )
-            .execute
+            for msg in messages
         )
+    )
 
+    for msg, msg_detail in zip(messages, details):
         headers = {
             h["name"]: h["value"]
             for h in msg_detail.get("payload", {}).get("headers", [])
@@ -103,6 +124,7 @@ async def get_gmail_message(
     user_google_email: str,
     message_id: str,
     format: str = "full",
+    fields: Optional[str] = None,
 ) -> str:
     """
     Get a specific Gmail message by ID.
@@ -111,6 +133,7 @@ async def get_gmail_message(
         user_google_email: The user's Google email address
         message_id: The message ID to retrieve
         format: Message format - "full", "metadata", or "minimal"
+        fields: Optional field mask for the response (default: MESSAGE_FIELDS)
 
     Returns:
         str: Formatted message content
@@ -119,10 +142,15 @@ async def get_gmail_message(
         f"[get_gmail_message] User: {user_google_email}, Message ID: {message_id}"
     )
 
-    msg = await asyncio.to_thread(
+    msg = await run_blocking(
         service.users()
         .messages()
-        .get(userId="me", id=message_id, format=format)
+        .get(
+            userId="me",
+            id=message_id,
+            format=format,
+            fields=fields or MESSAGE_FIELDS,
+        )
         .execute
     )
 
@@ -216,7 +244,7 @@ async def send_gmail_message(
 
     raw = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
 
-    sent_message = await asyncio.to_thread(
+    sent_message = await run_blocking(
         service.users().messages().send(userId="me", body={"raw": raw}).execute
     )
 
@@ -240,8 +268,8 @@ async def list_gmail_labels(
     """
     logger.info(f"[list_gmail_labels] User: {user_google_email}")
 
-    response = await asyncio.to_thread(
-        service.users().labels().list(userId="me").execute
+    response = await run_blocking(
+        service.users().labels().list(userId="me", fields=LABEL_FIELDS).execute
     )
 
     labels = response.get("labels", [])
@@ -323,8 +351,11 @@ async def modify_gmail_labels(
     if not body:
         return "No labels to modify. Provide add_labels or remove_labels."
 
-    result = await asyncio.to_thread(
-        service.users().messages().modify(userId="me", id=message_id, body=body).execute
+    result = await get_batch_coalescer().submit(
+        "gmail",
+        user_google_email,
+        service,
+        service.users().messages().modify(userId="me", id=message_id, body=body),
     )
 
     current_labels = result.get("labelIds", [])
@@ -339,3 +370,55 @@ async def modify_gmail_labels(
     output.append(f"Current labels: {', '.join(current_labels)}")
 
     return "\n".join(output)
+
+
+@handle_errors
+@with_gmail_service
+async def modify_gmail_labels_bulk(
+    service,
+    user_google_email: str,
+    message_ids: List[str],
+    add_labels: Optional[List[str]] = None,
+    remove_labels: Optional[List[str]] = None,
+) -> str:
+    """
+    Modify labels on multiple Gmail messages in a single request.
+
+    Args:
+        user_google_email: The user's Google email address
+        message_ids: List of message IDs to modify (sent 1000 per request)
+        add_labels: List of label IDs to add (e.g., ["STARRED", "IMPORTANT"])
+        remove_labels: List of label IDs to remove (e.g., ["UNREAD", "INBOX"])
+
+    Returns:
+        str: Confirmation with the number of messages modified
+    """
+    logger.info(
+        f"[modify_gmail_labels_bulk] User: {user_google_email}, Messages: {len(message_ids)}"
+    )
+
+    if not message_ids:
+        return "No messages to modify. Provide message_ids."
+
+    labels = {}
+    if add_labels:
+        labels["addLabelIds"] = add_labels
+    if remove_labels:
+        labels["removeLabelIds"] = remove_labels
+
+    if not labels:
+        return "No labels to modify. Provide add_labels or remove_labels."
+
+    for start in range(0, len(message_ids), BATCH_MODIFY_MAX_IDS):
+        body = {"ids": message_ids[start : start + BATCH_MODIFY_MAX_IDS], **labels}
+        await run_blocking(
+            service.users().messages().batchModify(userId="me", body=body).execute
+        )
+
+    output = [f"Modified {len(message_ids)} messages"]
+    if add_labels:
+        output.append(f"Added: {', '.join(add_labels)}")
+    if remove_labels:
+        output.append(f"Removed: {', '.join(remove_labels)}")
+
+    return "\n".join(output)
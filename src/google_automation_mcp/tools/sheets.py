@@ -9,15 +9,20 @@ Original: gsheets/sheets_tools.py
 Licensed under MIT License.
 """
 
-import asyncio
 import logging
 from typing import Optional, List
 
 from ..auth.service_adapter import with_sheets_service, with_drive_service
+from .batch import get_batch_coalescer
+from .concurrency import run_blocking
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
+# Partial-response masks: request only the fields the formatters read
+VALUES_FIELDS = "values"
+METADATA_FIELDS = "properties.title,sheets.properties(sheetId,title,gridProperties)"
+
 
 @handle_errors
 @with_drive_service
@@ -45,7 +50,7 @@ async def list_spreadsheets(
         escaped_query = query.replace("'", "\\'")
         base_query = f"{base_query} and name contains '{escaped_query}'"
 
-    results = await asyncio.to_thread(
+    results = await run_blocking(
         service.files()
         .list(
             q=base_query,
@@ -83,6 +88,7 @@ async def get_sheet_values(
     spreadsheet_id: str,
     range: str = "Sheet1",
     value_render: str = "FORMATTED_VALUE",
+    fields: Optional[str] = None,
 ) -> str:
     """
     Get values from a Google Sheet.
@@ -95,6 +101,7 @@ async def get_sheet_values(
                      - "FORMATTED_VALUE" (default) - as displayed in sheets
                      - "UNFORMATTED_VALUE" - raw values
                      - "FORMULA" - shows formulas
+        fields: Optional field mask for the response (default: VALUES_FIELDS)
 
     Returns:
         str: Formatted cell values
@@ -103,13 +110,14 @@ async def get_sheet_values(
         f"[get_sheet_values] User: {user_google_email}, Sheet: {spreadsheet_id}, Range: {range}"
     )
 
-    result = await asyncio.to_thread(
+    result = await run_blocking(
         service.spreadsheets()
         .values()
         .get(
             spreadsheetId=spreadsheet_id,
             range=range,
             valueRenderOption=value_render,
+            fields=fields or VALUES_FIELDS,
         )
         .execute
     )
@@ -169,7 +177,10 @@ async def update_sheet_values(
 
     body = {"values": values}
 
-    result = await asyncio.to_thread(
+    result = await get_batch_coalescer().submit(
+        "sheets",
+        user_google_email,
+        service,
         service.spreadsheets()
         .values()
         .update(
@@ -177,8 +188,7 @@ async def update_sheet_values(
             range=range,
             valueInputOption=value_input,
             body=body,
-        )
-        .execute
+        ),
     )
 
     updated_cells = result.get("updatedCells", 0)
@@ -245,9 +255,7 @@ async def create_spreadsheet(
         "sheets": sheets,
     }
 
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets().create(body=body).execute
-    )
+    spreadsheet = await run_blocking(service.spreadsheets().create(body=body).execute)
 
     spreadsheet_id = spreadsheet.get("spreadsheetId")
     created_sheets = [
@@ -299,7 +307,10 @@ async def append_sheet_values(
 
     body = {"values": values}
 
-    result = await asyncio.to_thread(
+    result = await get_batch_coalescer().submit(
+        "sheets",
+        user_google_email,
+        service,
         service.spreadsheets()
         .values()
         .append(
@@ -308,8 +319,7 @@ async def append_sheet_values(
             valueInputOption=value_input,
             insertDataOption="INSERT_ROWS",
             body=body,
-        )
-        .execute
+        ),
     )
 
     updates = result.get("updates", {})
@@ -349,9 +359,9 @@ async def get_spreadsheet_metadata(
         f"[get_spreadsheet_metadata] User: {user_google_email}, Sheet: {spreadsheet_id}"
     )
 
-    result = await asyncio.to_thread(
+    result = await run_blocking(
         service.spreadsheets()
-        .get(spreadsheetId=spreadsheet_id, fields="properties,sheets.properties")
+        .get(spreadsheetId=spreadsheet_id, fields=METADATA_FIELDS)
         .execute
     )
 
@@ -8,6 +8,8 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 
 class TestCredentialStore:
     """Tests for SecureCredentialStore."""
@@ -186,3 +188,259 @@ class TestScopes:
 
         scopes = get_scopes_for_tools(["appscript"])
         assert "https://www.googleapis.com/auth/script.projects" in scopes
+
+
+class TestServiceCache:
+    """Tests for the shared service transport."""
+
+    def test_service_reused_for_same_credentials(self):
+        """Test that services are built once per credentials."""
+        from google_automation_mcp.auth import transport
+
+        mock_creds = MagicMock()
+        mock_creds.refresh_token = "cache_refresh"
+
+        transport.clear_service_cache()
+        with patch(
+            "google_automation_mcp.auth.transport.build_from_document"
+        ) as mock_build:
+            first = transport.build_service("drive", "v3", mock_creds)
+            second = transport.build_service("drive", "v3", mock_creds)
+
+        assert first is second
+        assert mock_build.call_count == 1
+        transport.clear_service_cache()
+
+    def test_service_rebuilt_when_credentials_replaced(self):
+        """Test that new credentials for a user replace the cached service."""
+        from google_automation_mcp.auth import transport
+
+        old_creds = MagicMock(refresh_token=None, token="token_1")
+        new_creds = MagicMock(refresh_token=None, token="token_2")
+
+        transport.clear_service_cache()
+        with patch(
+            "google_automation_mcp.auth.transport.build_from_document"
+        ) as mock_build:
+            transport.build_service("drive", "v3", old_creds, "a@example.com")
+            transport.build_service("drive", "v3", new_creds, "a@example.com")
+
+        assert mock_build.call_count == 2
+        assert len(transport._services) == 1
+        transport.clear_service_cache()
+
+    def test_service_cache_bounded(self):
+        """Test that the least recently used services are evicted."""
+        from google_automation_mcp.auth import transport
+
+        transport.clear_service_cache()
+        with patch("google_automation_mcp.auth.transport.build_from_document"):
+            with patch.object(transport, "MAX_CACHED_SERVICES", 2):
+                for i in range(3):
+                    creds = MagicMock(refresh_token=f"refresh_{i}")
+                    transport.build_service("drive", "v3", creds, f"{i}@example.com")
+
+        assert [key[2] for key in transport._services] == [
+            "1@example.com",
+            "2@example.com",
+        ]
+        transport.clear_service_cache()
+
+    def test_discovery_document_read_once(self):
+        """Test that bundled discovery documents are loaded once per API."""
+        from google_automation_mcp.auth import transport
+
+        transport._discovery_document.cache_clear()
+        with patch(
+            "google_automation_mcp.auth.transport.get_static_doc",
+            return_value='{"name": "drive"}',
+        ) as mock_get_doc:
+            transport._discovery_document("drive", "v3")
+            transport._discovery_document("drive", "v3")
+
+        assert mock_get_doc.call_count == 1
+        transport._discovery_document.cache_clear()
+
+    def test_orjson_model_round_trip(self):
+        """Test that the orjson model encodes and decodes like JsonModel."""
+        from google_automation_mcp.auth.transport import OrjsonModel
+
+        model = OrjsonModel()
+        body = {"values": [["a", 1], ["b", 2.5]]}
+
+        assert json.loads(model.serialize(body)) == body
+        assert model.deserialize(b'{"values": [["a", 1]]}') == {"values": [["a", 1]]}
+        assert model.deserialize(b"not json") == "not json"
+
+    def test_httpx_transport_returns_httplib2_response(self):
+        """Test that the HTTP/2 transport mirrors httplib2's return value."""
+        from google_automation_mcp.auth.transport import HttpxTransport
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.reason_phrase = "OK"
+        mock_response.content = b"{}"
+        mock_response.headers.multi_items.return_value = [
+            ("Content-Type", "application/json"),
+            ("Content-Encoding", "gzip"),
+        ]
+
+        http = HttpxTransport()
+        with patch.object(http, "_get_client") as mock_get_client:
+            mock_get_client.return_value.request.return_value = mock_response
+            resp, content = http.request("https://www.googleapis.com/x", "GET")
+
+        assert resp.status == 200
+        assert resp["content-type"] == "application/json"
+        assert "content-encoding" not in resp
+        assert content == b"{}"
+
+
+class TestVerifyIdToken:
+    """Tests for local ID token verification."""
+
+    def test_rejects_unexpected_issuer(self):
+        """Test that tokens not issued by Google are rejected."""
+        import jwt
+        from google_automation_mcp.auth import jwks
+
+        claims = {"iss": "https://evil.example.com"}
+        with patch.object(jwks, "get_jwks_client"):
+            with patch.object(jwks.jwt, "decode", return_value=claims):
+                with pytest.raises(jwt.InvalidIssuerError):
+                    jwks.verify_id_token("token", "client_id")
+
+    def test_returns_claims_for_google_issuer(self):
+        """Test that claims are returned for tokens issued by Google."""
+        from google_automation_mcp.auth import jwks
+
+        claims = {"iss": "https://accounts.google.com", "email": "a@example.com"}
+        with patch.object(jwks, "get_jwks_client"):
+            with patch.object(jwks.jwt, "decode", return_value=claims):
+                assert jwks.verify_id_token("token", "client_id") == claims
+
+
+class TestCredentialCache:
+    """Tests for in-process credential caching."""
+
+    def test_cached_credentials_skip_store(self):
+        """Test that valid credentials are loaded from the store only once."""
+        from datetime import datetime, timedelta, timezone
+        from google_automation_mcp.auth import google_auth
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        mock_creds = MagicMock()
+        mock_creds.token = "cached_token"
+        mock_creds.expiry = now + timedelta(hours=1)
+        mock_store = MagicMock()
+        mock_store.get_credential.return_value = mock_creds
+
+        google_auth.clear_cached_credentials()
+        with patch(
+            "google_automation_mcp.auth.google_auth.get_credential_store",
+            return_value=mock_store,
+        ):
+            assert google_auth.get_credentials_for_user("a@example.com") is mock_creds
+            assert google_auth.get_credentials_for_user("a@example.com") is mock_creds
+
+        assert mock_store.get_credential.call_count == 1
+        mock_creds.refresh.assert_not_called()
+        google_auth.clear_cached_credentials()
+
+    def test_refreshes_before_expiry(self):
+        """Test that credentials close to expiry are refreshed and persisted."""
+        from datetime import datetime, timedelta, timezone
+        from google_automation_mcp.auth import google_auth
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        mock_creds = MagicMock()
+        mock_creds.token = "old_token"
+        mock_creds.refresh_token = "refresh"
+        mock_creds.expiry = now + timedelta(seconds=30)
+        mock_store = MagicMock()
+        mock_store.get_credential.return_value = mock_creds
+
+        google_auth.clear_cached_credentials()
+        with patch(
+            "google_automation_mcp.auth.google_auth.get_credential_store",
+            return_value=mock_store,
+        ):
+            assert google_auth.get_credentials_for_user("b@example.com") is mock_creds
+
+        mock_creds.refresh.assert_called_once()
+        mock_store.store_credential.assert_called_once_with("b@example.com", mock_creds)
+        google_auth.clear_cached_credentials()
+
+    def test_reloads_when_store_changes(self):
+        """Test that credentials rewritten by another process replace the cache."""
+        from datetime import datetime, timedelta, timezone
+        from google.oauth2.credentials import Credentials
+        from google_automation_mcp.auth import google_auth
+        from google_automation_mcp.auth.credential_store import SecureCredentialStore
+
+        expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SecureCredentialStore(base_dir=Path(tmpdir) / "credentials")
+            store.store_credential(
+                "c@example.com",
+                Credentials(token="old_token", scopes=["gmail"], expiry=expiry),
+            )
+
+            google_auth.clear_cached_credentials()
+            with patch(
+                "google_automation_mcp.auth.google_auth.get_credential_store",
+                return_value=store,
+            ):
+                first = google_auth.get_credentials_for_user("c@example.com")
+                assert google_auth.get_credentials_for_user("c@example.com") is first
+
+                # e.g. `google-automation-mcp setup` re-run to add scopes
+                SecureCredentialStore(base_dir=store.base_dir).store_credential(
+                    "c@example.com",
+                    Credentials(
+                        token="new_token", scopes=["gmail", "drive"], expiry=expiry
+                    ),
+                )
+                second = google_auth.get_credentials_for_user("c@example.com")
+
+        assert first.token == "old_token"
+        assert second.token == "new_token"
+        assert second.scopes == ["gmail", "drive"]
+        google_auth.clear_cached_credentials()
+
+
+class TestCompleteGoogleAuth:
+    """Tests for redirect URL validation in complete_google_auth."""
+
+    @pytest.mark.asyncio
+    async def test_url_without_code_rejected(self):
+        """Test that a URL without a code skips the token exchange."""
+        from google_automation_mcp.tools import auth_tools
+
+        with patch.object(auth_tools, "get_pending_flow", return_value=MagicMock()):
+            with patch.object(auth_tools, "clear_pending_flow") as mock_clear:
+                with patch.object(auth_tools, "complete_auth_flow") as mock_complete:
+                    result = await auth_tools.complete_google_auth(
+                        "http://localhost/?scope=email"
+                    )
+
+        assert "does not contain an authorization code" in result
+        mock_complete.assert_not_called()
+        mock_clear.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_error_redirect_reported(self):
+        """Test that an OAuth error redirect is reported without a token exchange."""
+        from google_automation_mcp.tools import auth_tools
+
+        with patch.object(auth_tools, "get_pending_flow", return_value=MagicMock()):
+            with patch.object(auth_tools, "clear_pending_flow") as mock_clear:
+                with patch.object(auth_tools, "complete_auth_flow") as mock_complete:
+                    result = await auth_tools.complete_google_auth(
+                        "http://localhost/?error=access_denied&state=abc"
+                    )
+
+        assert "Authorization was denied: access_denied" in result
+        mock_complete.assert_not_called()
+        mock_clear.assert_called_once()
@@ -67,6 +67,41 @@ class TestSearchGmailMessages:
 
             assert "No messages found" in result
 
+    @pytest.mark.asyncio
+    async def test_search_messages_fetches_details_concurrently(self):
+        """Test that message details are fetched in parallel and kept in order."""
+        import threading
+
+        ids = ["msg0", "msg1", "msg2"]
+        # Every fetch waits for the others, so a sequential loop would time out
+        barrier = threading.Barrier(len(ids), timeout=2)
+
+        def get_message(**kwargs):
+            def execute():
+                barrier.wait()
+                return {
+                    "payload": {"headers": [{"name": "Subject", "value": kwargs["id"]}]}
+                }
+
+            return Mock(execute=execute)
+
+        mock_service = Mock()
+        mock_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": i} for i in ids]
+        }
+        mock_service.users().messages().get.side_effect = get_message
+
+        with patch(SERVICE_PATCH, return_value=mock_service):
+            from google_automation_mcp.tools.gmail import search_gmail_messages
+
+            result = await search_gmail_messages(
+                user_google_email="user@example.com", query=""
+            )
+
+        assert "Found 3 messages" in result
+        positions = [result.index(f"Subject: {i}") for i in ids]
+        assert positions == sorted(positions)
+
 
 class TestListGmailLabels:
     """Tests for list_gmail_labels."""
@@ -119,6 +154,51 @@ class TestModifyGmailLabels:
             assert "Removed:" in result
 
 
+class TestModifyGmailLabelsBulk:
+    """Tests for modify_gmail_labels_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_modify_labels_bulk_success(self):
+        """Test modifying labels on several messages in one request."""
+        mock_service = Mock()
+        mock_service.users().messages().batchModify().execute.return_value = {}
+
+        with patch(SERVICE_PATCH, return_value=mock_service):
+            from google_automation_mcp.tools.gmail import modify_gmail_labels_bulk
+
+            result = await modify_gmail_labels_bulk(
+                user_google_email="user@example.com",
+                message_ids=["msg1", "msg2", "msg3"],
+                remove_labels=["UNREAD"],
+            )
+
+            assert "Modified 3 messages" in result
+            assert "Removed: UNREAD" in result
+
+    @pytest.mark.asyncio
+    async def test_modify_labels_bulk_splits_large_lists(self):
+        """Test that more than 1000 IDs are sent in several batchModify calls."""
+        mock_service = Mock()
+        batch_modify = mock_service.users().messages().batchModify
+        batch_modify.return_value.execute.return_value = {}
+        batch_modify.reset_mock()
+        message_ids = [f"msg{i}" for i in range(2500)]
+
+        with patch(SERVICE_PATCH, return_value=mock_service):
+            from google_automation_mcp.tools.gmail import modify_gmail_labels_bulk
+
+            result = await modify_gmail_labels_bulk(
+                user_google_email="user@example.com",
+                message_ids=message_ids,
+                add_labels=["STARRED"],
+            )
+
+        sent = [call.kwargs["body"]["ids"] for call in batch_modify.call_args_list]
+        assert [len(ids) for ids in sent] == [1000, 1000, 500]
+        assert sum(sent, []) == message_ids
+        assert "Modified 2500 messages" in result
+
+
 # ============================================================================
 # Drive Tests
 # ============================================================================
@@ -192,6 +272,67 @@ class TestListDriveItems:
             assert "My File.txt" in result
 
 
+class TestGetDriveFileContent:
+    """Tests for get_drive_file_content."""
+
+    @pytest.mark.asyncio
+    async def test_large_file_truncated(self):
+        """Test that downloads stop once max_bytes have been received."""
+        mock_service = Mock()
+        mock_service.files().get().execute.return_value = {
+            "id": "file123",
+            "name": "big.txt",
+            "mimeType": "text/plain",
+        }
+        chunks_fetched = []
+
+        class FakeDownload:
+            def __init__(self, fh, request, chunksize):
+                self.fh = fh
+                self.chunksize = chunksize
+
+            def next_chunk(self):
+                chunks_fetched.append(self.chunksize)
+                self.fh.write(b"x" * self.chunksize)
+                return None, len(chunks_fetched) == 100
+
+        with patch(SERVICE_PATCH, return_value=mock_service):
+            with patch(
+                "google_automation_mcp.tools.drive.MediaIoBaseDownload", FakeDownload
+            ):
+                from google_automation_mcp.tools.drive import get_drive_file_content
+
+                result = await get_drive_file_content(
+                    user_google_email="user@example.com",
+                    file_id="file123",
+                    max_bytes=10,
+                )
+
+        assert len(chunks_fetched) == 1
+        assert "x" * 10 + "\n\n[Content truncated at 10 bytes]" in result
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_bytes", [0, -1])
+    async def test_invalid_max_bytes_rejected(self, max_bytes):
+        """Test that a non-positive max_bytes is rejected before downloading."""
+        mock_service = Mock()
+
+        with patch(SERVICE_PATCH, return_value=mock_service):
+            with patch(
+                "google_automation_mcp.tools.drive.MediaIoBaseDownload"
+            ) as mock_download:
+                from google_automation_mcp.tools.drive import get_drive_file_content
+
+                result = await get_drive_file_content(
+                    user_google_email="user@example.com",
+                    file_id="file123",
+                    max_bytes=max_bytes,
+                )
+
+        assert result == "max_bytes must be at least 1."
+        mock_download.assert_not_called()
+
+
 class TestCreateDriveFolder:
     """Tests for create_drive_folder."""
 
@@ -322,6 +463,58 @@ class TestListDrivePermissions:
             assert "reader" in result
 
 
+class TestRemoveDrivePermissionsBulk:
+    """Tests for remove_drive_permissions_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_remove_permissions_bulk_success(self):
+        """Test removing several permissions in one call."""
+        mock_service = Mock()
+        mock_service.permissions().delete().execute.return_value = None
+
+        with patch(SERVICE_PATCH, return_value=mock_service):
+            from google_automation_mcp.tools.drive import (
+                remove_drive_permissions_bulk,
+            )
+
+            result = await remove_drive_permissions_bulk(
+                user_google_email="user@example.com",
+                file_id="file123",
+                permission_ids=["perm1"],
+            )
+
+            assert "Removed 1 of 1 permissions from file file123" in result
+
+    @pytest.mark.asyncio
+    async def test_remove_permissions_bulk_reports_failures(self):
+        """Test that several removals share a batch and failures are named."""
+        mock_service = Mock()
+        mock_service.permissions().delete.side_effect = lambda **kw: kw["permissionId"]
+        batches = []
+
+        def new_batch(callback):
+            batches.append(FailingBatch(callback, failing={"perm2"}))
+            return batches[-1]
+
+        mock_service.new_batch_http_request.side_effect = new_batch
+
+        with patch(SERVICE_PATCH, return_value=mock_service):
+            from google_automation_mcp.tools.drive import (
+                remove_drive_permissions_bulk,
+            )
+
+            result = await remove_drive_permissions_bulk(
+                user_google_email="user@example.com",
+                file_id="file123",
+                permission_ids=["perm1", "perm2", "perm3"],
+            )
+
+        assert len(batches) == 1
+        assert "Removed 2 of 3 permissions from file file123" in result
+        assert "Failed: perm2 (perm2 not found)" in result
+        assert "Failed: perm1" not in result
+
+
 # ============================================================================
 # Sheets Tests
 # ============================================================================
@@ -355,6 +548,25 @@ class TestGetSheetValues:
             assert "Name" in result
             assert "Alice" in result
 
+    @pytest.mark.asyncio
+    async def test_get_values_uses_field_mask(self):
+        """Test that only the values field is requested by default."""
+        mock_service = Mock()
+        mock_service.spreadsheets().values().get().execute.return_value = {
+            "values": [["A1"]]
+        }
+
+        with patch(SERVICE_PATCH, return_value=mock_service):
+            from google_automation_mcp.tools.sheets import get_sheet_values
+
+            await get_sheet_values(
+                user_google_email="user@example.com",
+                spreadsheet_id="sheet123",
+            )
+
+            _, kwargs = mock_service.spreadsheets().values().get.call_args
+            assert kwargs["fields"] == "values"
+
 
 class TestCreateSpreadsheet:
     """Tests for create_spreadsheet."""
@@ -542,6 +754,35 @@ class TestUpdateEvent:
             assert "Updated Meeting" in result
 
 
+class TestDeleteEventsBulk:
+    """Tests for delete_events_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_delete_events_bulk_reports_failures(self):
+        """Test that several deletions share a batch and failures are named."""
+        mock_service = Mock()
+        mock_service.events().delete.side_effect = lambda **kwargs: kwargs["eventId"]
+        batches = []
+
+        def new_batch(callback):
+            batches.append(FailingBatch(callback, failing={"event3"}))
+            return batches[-1]
+
+        mock_service.new_batch_http_request.side_effect = new_batch
+
+        with patch(SERVICE_PATCH, return_value=mock_service):
+            from google_automation_mcp.tools.calendar import delete_events_bulk
+
+            result = await delete_events_bulk(
+                user_google_email="user@example.com",
+                event_ids=["event1", "event2", "event3"],
+            )
+
+        assert len(batches) == 1
+        assert "Deleted 2 of 3 events from calendar: primary" in result
+        assert "Failed: event3 (event3 not found)" in result
+
+
 # ============================================================================
 # Docs Tests
 # ============================================================================
@@ -661,3 +902,343 @@ class TestAppendDocText:
 
             assert "Appended text to document" in result
             assert "doc123" in result
+
+
+# ============================================================================
+# Batch Coalescer Tests
+# ============================================================================
+
+
+class FakeBatch:
+    """Minimal BatchHttpRequest stand-in that answers every sub-request."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = {}
+
+    def add(self, request, request_id):
+        self.requests[request_id] = request
+
+    def execute(self):
+        for request_id, request in self.requests.items():
+            self.callback(request_id, {"id": request}, None)
+
+
+class FailingBatch(FakeBatch):
+    """FakeBatch that fails the sub-requests listed in failing."""
+
+    def __init__(self, callback, failing):
+        super().__init__(callback)
+        self.failing = failing
+
+    def execute(self):
+        for request_id, request in self.requests.items():
+            if request in self.failing:
+                self.callback(request_id, None, Exception(f"{request} not found"))
+            else:
+                self.callback(request_id, {}, None)
+
+
+class TestBatchCoalescer:
+    """Tests for BatchCoalescer."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self):
+        """Test that requests for the same service and user are batched."""
+        import asyncio
+        from google_automation_mcp.tools.batch import BatchCoalescer
+
+        batches = []
+        mock_service = Mock()
+
+        def new_batch(callback):
+            batches.append(FakeBatch(callback))
+            return batches[-1]
+
+        mock_service.new_batch_http_request.side_effect = new_batch
+
+        coalescer = BatchCoalescer()
+        results = await asyncio.gather(
+            *(
+                coalescer.submit("drive", "user@example.com", mock_service, f"req{i}")
+                for i in range(3)
+            )
+        )
+
+        assert len(batches) == 1
+        assert results == [{"id": "req0"}, {"id": "req1"}, {"id": "req2"}]
+
+    @pytest.mark.asyncio
+    async def test_missing_sub_response_fails_request(self):
+        """Test that a sub-request without a batch response raises an error."""
+        import asyncio
+        from google_automation_mcp.tools.batch import BatchCoalescer
+
+        class PartialBatch(FakeBatch):
+            def execute(self):
+                del self.requests["1"]
+                super().execute()
+
+        mock_service = Mock()
+        mock_service.new_batch_http_request.side_effect = PartialBatch
+
+        coalescer = BatchCoalescer()
+        results = await asyncio.gather(
+            *(
+                coalescer.submit("drive", "user@example.com", mock_service, f"req{i}")
+                for i in range(3)
+            ),
+            return_exceptions=True,
+        )
+
+        assert results[0] == {"id": "req0"}
+        assert isinstance(results[1], RuntimeError)
+        assert "req1" in str(results[1])
+        assert results[2] == {"id": "req2"}
+
+    @pytest.mark.asyncio
+    async def test_batch_build_error_fails_every_request(self):
+        """Test that an error building the batch reaches every caller."""
+        import asyncio
+        from google_automation_mcp.tools.batch import BatchCoalescer
+
+        mock_service = Mock()
+        mock_service.new_batch_http_request.side_effect = ValueError("bad batch")
+
+        coalescer = BatchCoalescer()
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(
+                    coalescer.submit(
+                        "drive", "user@example.com", mock_service, f"req{i}"
+                    )
+                    for i in range(2)
+                ),
+                return_exceptions=True,
+            ),
+            timeout=2,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_aclose_fails_queued_requests(self):
+        """Test that closing the coalescer fails requests it had not sent."""
+        import asyncio
+        from google_automation_mcp.tools.batch import BatchCoalescer
+
+        coalescer = BatchCoalescer(max_wait_ms=1000)
+        pending = asyncio.ensure_future(
+            coalescer.submit("drive", "user@example.com", Mock(), "req0")
+        )
+        await asyncio.sleep(0.01)
+
+        await coalescer.aclose()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            await pending
+        assert coalescer._worker is None
+
+    @pytest.mark.asyncio
+    async def test_single_request_executes_directly(self):
+        """Test that a lone request skips the batch endpoint."""
+        from google_automation_mcp.tools.batch import BatchCoalescer
+
+        mock_service = Mock()
+        mock_request = Mock()
+        mock_request.execute.return_value = {"id": "perm123"}
+
+        coalescer = BatchCoalescer()
+        result = await coalescer.submit(
+            "drive", "user@example.com", mock_service, mock_request
+        )
+
+        assert result == {"id": "perm123"}
+        mock_service.new_batch_http_request.assert_not_called()
+
+
+class TestServerLifespan:
+    """Tests for the server lifespan."""
+
+    @pytest.mark.asyncio
+    async def test_session_exit_keeps_executor_for_other_sessions(self):
+        """Test that closing one session doesn't break worker threads in another."""
+        import asyncio
+        from google_automation_mcp.server import lifespan, mcp
+
+        async with lifespan(mcp):
+            async with lifespan(mcp):
+                pass
+
+            assert await asyncio.to_thread(lambda: "ok") == "ok"
+
+    @pytest.mark.asyncio
+    async def test_session_exit_keeps_transport_open(self):
+        """Test that closing one session doesn't close the shared HTTP client."""
+        from google_automation_mcp.auth.transport import _shared_http
+        from google_automation_mcp.server import lifespan, mcp
+
+        client = _shared_http._get_client()
+        async with lifespan(mcp):
+            pass
+
+        assert not client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_last_session_exit_stops_batch_worker(self):
+        """Test that the batch worker is cancelled once every session has ended."""
+        import asyncio
+        from google_automation_mcp.server import lifespan, mcp
+        from google_automation_mcp.tools.batch import get_batch_coalescer
+
+        coalescer = get_batch_coalescer()
+        async with lifespan(mcp):
+            async with lifespan(mcp):
+                coalescer._ensure_worker(asyncio.get_running_loop())
+                worker = coalescer._worker
+
+            assert not worker.done()
+
+        assert worker.cancelled()
+
+
+class TestEventLoopOptions:
+    """Tests for choosing the server's event loop."""
+
+    def test_no_options_without_uvloop(self):
+        """Test that the default asyncio loop is used when uvloop is missing."""
+        from google_automation_mcp.server import _event_loop_options
+
+        # A None entry makes the import raise ImportError
+        with patch.dict("sys.modules", {"uvloop": None}):
+            assert _event_loop_options() == {}
+
+    def test_uvloop_used_when_installed(self):
+        """Test that anyio is asked for a uvloop loop when uvloop imports."""
+        from google_automation_mcp.server import _event_loop_options
+
+        with patch.dict("sys.modules", {"uvloop": Mock()}):
+            assert _event_loop_options() == {"use_uvloop": True}
+
+
+class TestRegisterWorkspaceTools:
+    """Tests for workspace tool registration."""
+
+    def test_servers_get_separate_tool_objects(self):
+        """Test that each registration builds its own Tool instances."""
+        from google_automation_mcp.server_workspace import _workspace_tools
+
+        first, second = _workspace_tools(), _workspace_tools()
+
+        assert [t.name for t in first] == [t.name for t in second]
+        assert not {id(t) for t in first} & {id(t) for t in second}
+
+
+class TestTokenBucket:
+    """Tests for the client-side rate limiter."""
+
+    def test_burst_available_immediately(self):
+        """Test that a full bucket serves a burst without waiting."""
+        from google_automation_mcp.core.ratelimit import TokenBucket
+
+        bucket = TokenBucket(rate=1.0, burst=3)
+
+        assert [bucket._reserve(1) for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_waits_for_refill_beyond_burst(self):
+        """Test that requests beyond the burst wait for tokens to refill."""
+        from google_automation_mcp.core.ratelimit import TokenBucket
+
+        bucket = TokenBucket(rate=10.0, burst=1)
+
+        assert bucket._reserve(1) == 0.0
+        assert bucket._reserve(1) == pytest.approx(0.1, abs=0.01)
+        assert bucket._reserve(1) == pytest.approx(0.2, abs=0.01)
+
+    def test_unlisted_service_not_limited(self):
+        """Test that services without a configured limit have no bucket."""
+        from google_automation_mcp.core.ratelimit import get_bucket
+
+        assert get_bucket("script", "user@example.com") is None
+
+    def test_buckets_bounded(self):
+        """Test that the least recently used buckets are evicted."""
+        from google_automation_mcp.core import ratelimit
+
+        with patch.object(ratelimit, "MAX_BUCKETS", 2):
+            ratelimit._buckets.clear()
+            first = ratelimit.get_bucket("gmail", "a@example.com")
+            ratelimit.get_bucket("gmail", "b@example.com")
+            assert ratelimit.get_bucket("gmail", "a@example.com") is first
+            ratelimit.get_bucket("gmail", "c@example.com")
+
+            assert list(ratelimit._buckets) == [
+                ("gmail", "a@example.com"),
+                ("gmail", "c@example.com"),
+            ]
+        ratelimit._buckets.clear()
+
+    @pytest.mark.asyncio
+    async def test_service_tool_spends_token_per_api_call(self):
+        """Test that each API call made by a with_service tool is paced."""
+        from unittest.mock import AsyncMock
+
+        mock_service = Mock()
+        mock_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": "msg0"}, {"id": "msg1"}]
+        }
+        mock_service.users().messages().get().execute.return_value = {}
+        acquire = AsyncMock()
+
+        with (
+            patch(SERVICE_PATCH, return_value=mock_service),
+            patch(
+                "google_automation_mcp.tools.concurrency.acquire_rate_limit", acquire
+            ),
+        ):
+            from google_automation_mcp.tools.gmail import search_gmail_messages
+
+            await search_gmail_messages(user_google_email="user@example.com")
+
+        # One list call plus one get per message
+        assert acquire.await_count == 3
+        for call in acquire.await_args_list:
+            assert call.args == ("gmail", "user@example.com")
+
+    @pytest.mark.asyncio
+    async def test_batched_requests_charged_once_each(self):
+        """Test that a coalesced batch is charged per sub-request, not again on execute."""
+        import asyncio
+        from unittest.mock import AsyncMock
+        from google_automation_mcp.core.context import set_rate_limit_key
+        from google_automation_mcp.tools.batch import BatchCoalescer
+
+        mock_service = Mock()
+        mock_service.new_batch_http_request.side_effect = FakeBatch
+        acquire = AsyncMock()
+
+        # As inside a with_service tool: the worker starts in this context
+        set_rate_limit_key(("drive", "user@example.com"))
+        try:
+            with (
+                patch("google_automation_mcp.tools.batch.acquire_rate_limit", acquire),
+                patch(
+                    "google_automation_mcp.tools.concurrency.acquire_rate_limit",
+                    acquire,
+                ),
+            ):
+                coalescer = BatchCoalescer()
+                await asyncio.gather(
+                    *(
+                        coalescer.submit(
+                            "drive", "user@example.com", mock_service, f"req{i}"
+                        )
+                        for i in range(3)
+                    )
+                )
+                await coalescer.aclose()
+        finally:
+            set_rate_limit_key(None)
+
+        assert mock_service.new_batch_http_request.call_count == 1
+        assert acquire.await_count == 3